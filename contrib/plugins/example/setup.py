@@ -15,7 +15,7 @@ setup(
 
     install_requires=["typer"],
 
-    entry_points={"cranecli.plugins": "example = cranecli_plugin_example"},
+    entry_points={"cranecli.plugins": "example_plugin = cranecli_plugin_example"},
 
     classifiers=[
         "Development Status :: 2 - Pre-Alpha",
@@ -15,14 +15,35 @@
 
 """Crane CLI typer-related utilities."""
 
-from functools import wraps
-from typing import Callable
+from __future__ import annotations
 
+import importlib
+import json
+import shutil
+import time
+import weakref
+from functools import partial, wraps
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+
+import click
 import typer
+from typer.main import get_command, get_group
 
 from crane.cli.common.context import TyperContext
 from crane.cli.common.display import error
-from crane.lib.sync.client import AbstractCraneClient
+from crane.common.constant import LOCAL_CRANE_FOLDER
+from crane.common.util.context import atomic_write
+
+if TYPE_CHECKING:
+    from crane.lib.sync.client import AbstractCraneClient
+
+# a successful health check is reused by cli runs within this many seconds
+_HEALTH_CACHE_TTL = 5.0
+
+# clients that passed the health check in this process. weak references, as
+# the id of a garbage-collected client may be reused by another client
+_HEALTHY_CLIENTS: weakref.WeakSet[AbstractCraneClient] = weakref.WeakSet()
 
 
 # todo: add type hints
@@ -50,8 +71,172 @@ def check_connection(f: Callable) -> Callable:
     def _check(**kwargs):
         ctx: TyperContext[AbstractCraneClient] = kwargs["ctx"]
         client = ctx.obj
-        if not client.is_healthy():
+        if not _is_healthy(client):
             error("Connection to server failed.\nTry changing the cli configuration.")
         return f(**kwargs)
 
     return _check
+
+
+def _is_healthy(client: AbstractCraneClient) -> bool:
+    """Check server health, reusing a recent successful check.
+
+    Successful checks are remembered per client in this process, and for
+    `_HEALTH_CACHE_TTL` seconds per server url across processes, so that
+    commands run in a tight shell loop do not ping the server every time.
+    """
+    if client in _HEALTHY_CLIENTS:
+        return True
+
+    cache_path = LOCAL_CRANE_FOLDER / "health.cache"
+    url = client.config.url
+    now = time.time()
+
+    try:
+        with cache_path.open(encoding="utf8") as f:
+            cache = json.load(f)
+        if cache["url"] == url and 0 <= now - cache["time"] < _HEALTH_CACHE_TTL:
+            _HEALTHY_CLIENTS.add(client)
+            return True
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if not client.is_healthy():
+        return False
+    _HEALTHY_CLIENTS.add(client)
+
+    try:
+        with atomic_write(str(cache_path)) as f:
+            json.dump({"url": url, "time": now}, f)
+    except OSError:
+        pass
+    return True
+
+
+class LazyTyperGroup(click.Group):
+    """Click group that loads its typer app on first use.
+
+    Rendering the parent help only needs the name and help text of the group,
+    so the typer app is loaded only when the group is actually resolved
+    (invoked, completed or its own help is requested).
+    """
+
+    def __init__(self, *, load_app: Callable[[], typer.Typer], **attrs: Any) -> None:
+        """Initialize."""
+        super().__init__(**attrs)
+        self.load_app = load_app
+        self._group: click.Group | None = None
+
+    def _load(self) -> click.Group:
+        if self._group is None:
+            group = get_group(self.load_app())
+            group.help = group.help or self.help
+            group.short_help = group.short_help or self.short_help
+            self._group = group
+        return self._group
+
+    def get_short_help_str(self, limit: int = 45) -> str:
+        """Return short help, loading the app if none was given on registration.
+
+        Plugins are registered by name only, so their help comes from the app.
+        """
+        if self.help or self.short_help:
+            return super().get_short_help_str(limit)
+        try:
+            return self._load().get_short_help_str(limit)
+        except Exception:  # pylint: disable=broad-except
+            # a broken plugin should not break the help of other commands
+            return ""
+
+    def make_context(
+        self,
+        info_name: str,
+        args: list[str],
+        parent: click.Context | None = None,
+        **extra: Any,
+    ) -> click.Context:
+        """Create context of the loaded group, which then handles the invocation."""
+        return self._load().make_context(info_name, args, parent=parent, **extra)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return subcommand names of the loaded typer app."""
+        return self._load().list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return subcommand of the loaded typer app."""
+        return self._load().get_command(ctx, cmd_name)
+
+
+def import_typer_app(module_path: str) -> typer.Typer:
+    """Import module and return its typer app."""
+    return importlib.import_module(module_path).app
+
+
+def add_lazy_typer(
+    app: typer.Typer, load_app: str | Callable[[], typer.Typer], **kwargs: Any
+) -> None:
+    """Add a sub typer app to the given app, deferring loading the sub app.
+
+    Args:
+        app (typer.Typer): parent typer application
+        load_app (str | Callable[[], typer.Typer]): Function that returns the sub
+            app, or path of the module that defines the sub app as `app`
+        kwargs: keyword arguments passed to `typer.Typer.add_typer`
+
+    """
+    if isinstance(load_app, str):
+        load_app = partial(import_typer_app, load_app)
+
+    cls = partial(LazyTyperGroup, load_app=load_app)
+    app.add_typer(typer.Typer(), cls=cls, **kwargs)  # type: ignore
+
+
+def echo_help_with_cache(
+    app: typer.Typer,
+    prog_name: str,
+    version: str,
+    cache_path: Path,
+    plugins: str = "",
+) -> None:
+    """Print help of the typer app, reusing help rendered by a previous run.
+
+    Rendering help builds the whole click command tree. The rendered help is
+    cached in a file keyed by everything that changes the output: version,
+    installed plugins, program name and terminal width. Failing to read or
+    write the cache is silently ignored.
+
+    Args:
+        app (typer.Typer): typer application
+        prog_name (str): program name shown in the usage
+        version (str): version of the app
+        cache_path (Path): path of help cache file
+        plugins (str): versions of installed plugins
+
+    """
+    columns = shutil.get_terminal_size().columns
+    key = f"{version}|{plugins}|{prog_name}|{columns}"
+
+    try:
+        with cache_path.open(encoding="utf8") as f:
+            cache = json.load(f)
+        if cache["key"] == key:
+            typer.echo(cache["help"])
+            return
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    help_text = _render_help(app, prog_name)
+    typer.echo(help_text)
+
+    try:
+        with atomic_write(str(cache_path)) as f:
+            json.dump({"key": key, "help": help_text}, f)
+    except OSError:
+        # e.g. read-only home directory
+        pass
+
+
+def _render_help(app: typer.Typer, prog_name: str) -> str:
+    command = get_command(app)
+    with click.Context(command, info_name=prog_name, **command.context_settings) as ctx:
+        return command.get_help(ctx)
@@ -18,27 +18,76 @@
 from __future__ import annotations
 
 import json
-import platform
-import pprint
-import sys
+import re
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
 
 import typer
 
-from crane import __version__ as crane_v
 from crane.cli.common.context import TyperContext
 from crane.cli.common.display import error, info
-from crane.lib.sync.client import AbstractCraneClient, ClientConfig
+
+if TYPE_CHECKING:
+    from crane.lib.sync.client import AbstractCraneClient, ClientConfig
 
 USING_LOCAL_CRANE_WARNING = """\
 crane-cli will send requests to locally running crane.\
 """
 
+_URL_PATTERN = re.compile(r"(https?|uds)://")
+
+_CHECKPOINT_PATH = Path(__file__).resolve().parent.parent.parent / "checkpoint.json"
+
 
-class GenericTyperContext(TyperContext[AbstractCraneClient[ClientConfig]]):
+class GenericTyperContext(TyperContext["AbstractCraneClient[ClientConfig]"]):
     """Generic typer context for crane apps."""
 
 
+class _LazyClient:
+    """Proxy of a crane client that is created on first attribute access.
+
+    Creating a client reads the configuration file and sets up a http session,
+    which is unnecessary for invocations that never use the client
+    (e.g. `crane job --help`).
+    """
+
+    def __init__(self, load_client_cls: Callable[[], type[AbstractCraneClient]]):
+        """Initialize."""
+        self._load_client_cls = load_client_cls
+        self._client: AbstractCraneClient | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        """Create the client if not created, and return its attribute."""
+        if self._client is None:
+            self._client = self._load_client_cls().from_config()
+        return getattr(self._client, name)
+
+
+@lru_cache(maxsize=1)
+def _load_git_info() -> str:
+    """Return git information of the installed crane, read from checkpoint."""
+    try:
+        with _CHECKPOINT_PATH.open() as f:
+            ckpt = json.load(f)
+            return (
+                f"Git branch:\t\t{ckpt['git_branch']}\n"
+                f"Git commit:\t\t{ckpt['git_commit']}\n"
+                f"Git timestamp:\t\t{ckpt['git_timestamp']}"
+            )
+    except OSError:
+        return "Git info:\t\tNot Available"
+
+
+@lru_cache(maxsize=1)
+def _get_os_arch() -> str:
+    """Return os and architecture of the running platform."""
+    import platform  # pylint: disable=import-outside-toplevel
+
+    architecture = platform.processor() or "Not Available"
+    return f"{platform.system()}/{architecture}"
+
+
 def _print_version(print_version: bool) -> None:
     """A Callback function that implements CLI option '--version'.
 
@@ -46,48 +95,39 @@ def _print_version(print_version: bool) -> None:
         print_version (bool): This sets to be True when option '--version' gets passed.
 
     """
-    checkpoint_file = "checkpoint.json"
-    checkpoint_path = Path(__file__).absolute().parent.parent.parent / checkpoint_file
-
     if not print_version:
         return
 
-    try:
-        with checkpoint_path.open() as f:
-            git_checkpoint = json.load(f)
-            git_info = (
-                "Git branch:\t\t{ckpt[git_branch]}\n"
-                + "Git commit:\t\t{ckpt[git_commit]}\n"
-                + "Git timestamp:\t\t{ckpt[git_timestamp]}"
-            ).format(ckpt=git_checkpoint)
-    except OSError:
-        git_info = "Git info:\t\tNot Available"
+    # pylint: disable=import-outside-toplevel
+    import sys
 
-    version_info = "Python version:\t\t{v.major}.{v.minor}.{v.micro}".format(
-        v=sys.version_info
-    )
-    architecture = platform.processor() or "Not Available"
+    from crane import __version__ as crane_v
+
+    py_v = sys.version_info
 
     info(
-        "\n".join(
-            [
-                f"Version:\t\t{crane_v}",
-                version_info,
-                git_info,
-                f"OS/Arch:\t\t{platform.system()}/{architecture}",
-            ]
-        )
+        f"Version:\t\t{crane_v}\n"
+        f"Python version:\t\t{py_v.major}.{py_v.minor}.{py_v.micro}\n"
+        f"{_load_git_info()}\n"
+        f"OS/Arch:\t\t{_get_os_arch()}"
     )
 
     raise typer.Exit(code=0)
 
 
-def add_config_commands(app: typer.Typer, client_cls: type[AbstractCraneClient]):
+def add_config_commands(
+    app: typer.Typer, load_client_cls: Callable[[], type[AbstractCraneClient]]
+):
     """Change url type and path.
 
+    The client class is loaded and the client is created when a command first
+    accesses the client, so that the client stack is not imported when the cli
+    only parses its options (e.g. `--help`).
+
     Args:
         app (typer.Typer): typer application
-        client_cls (type[AbstractCraneClient]): Client class
+        load_client_cls (Callable[[], type[AbstractCraneClient]]): Function that
+            imports and returns the client class
 
     """
     # define callback
@@ -105,8 +145,7 @@ def add_config_commands(app: typer.Typer, client_cls: type[AbstractCraneClient])
             is_eager=True,
         ),
     ) -> None:
-        nonlocal client_cls
-        ctx.obj = client_cls.from_config()
+        ctx.obj = _LazyClient(load_client_cls)
 
     config_sub_app = typer.Typer()
 
@@ -122,7 +161,7 @@ def add_config_commands(app: typer.Typer, client_cls: type[AbstractCraneClient])
 
         value = value[len("url=") :]
 
-        if not value.startswith(("http", "uds")):
+        if not _URL_PATTERN.match(value):
             error("Invalid url. should start with http:// or uds://")
 
         ctx.obj.config.url = value
@@ -133,7 +172,8 @@ def add_config_commands(app: typer.Typer, client_cls: type[AbstractCraneClient])
     def list_config(ctx: GenericTyperContext) -> None:
         """Get current crane url."""
         cli_ctx = ctx.obj
-        info(pprint.pformat(cli_ctx.config.to_dict()))
+        config = cli_ctx.config.to_dict()
+        info(json.dumps(config, indent=2, sort_keys=True, default=str))
 
     app.add_typer(
         config_sub_app,
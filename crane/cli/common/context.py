@@ -17,13 +17,14 @@
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 import typer
 
-from crane.lib.sync.client import AbstractCraneClient
+if TYPE_CHECKING:
+    from crane.lib.sync.client import AbstractCraneClient
 
-T = TypeVar("T", bound=AbstractCraneClient)
+T = TypeVar("T", bound="AbstractCraneClient")
 
 
 class TyperContext(typer.Context, Generic[T]):
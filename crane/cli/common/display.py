@@ -19,51 +19,87 @@ from __future__ import annotations
 
 import datetime
 import os
-from typing import NoReturn
+import re
+import sys
+import threading
+from types import TracebackType
+from typing import IO, NoReturn
 
 import typer
-from dateutil.parser import parse
 
-import crane.common.constant as C
+from crane.common.constant import CLIEnv
 
+# same pattern as click.unstyle
+_ANSI_ESCAPE = re.compile(r"\033\[((?:\d|;)*)([a-zA-Z])")
 
-def build_time_delta(prev_time: str | datetime.datetime) -> str:
+# id of stream -> (stream, whether the stream is a terminal).
+# the stream is kept to tell it apart from a later stream with the same id
+_TTY_CACHE: dict[int, tuple[IO, bool]] = {}
+_TTY_CACHE_SIZE = 8
+
+# (seconds per unit, suffix) in descending order of unit size
+_TIME_UNITS = (
+    (365 * 24 * 3600, "y"),
+    (24 * 3600, "d"),
+    (3600, "h"),
+    (60, "m"),
+)
+
+
+def utcnow() -> datetime.datetime:
+    """Return timezone-aware current utc time."""
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+def build_time_delta(
+    prev_time: str | datetime.datetime, now: datetime.datetime | None = None
+) -> str:
     """Create a coarse time delta between now and the given point of time.
 
+    Naive datetimes are regarded as utc.
+
     Args:
         prev_time (str | datetime.datetime): datetime string
+        now (datetime.datetime | None): current utc time. Pass it when building
+            many time deltas at once. Defaults to `utcnow()`.
 
     Returns:
         A coarse string representation of time delta
 
     """
     if isinstance(prev_time, str):
-        prev_time = parse(prev_time)
-
-    current_time = datetime.datetime.utcnow()
-    time_elapsed = current_time - prev_time
-
-    year = time_elapsed.days // 365
-    hour = time_elapsed.seconds // 3600
-    minute = time_elapsed.seconds // 60
-
-    if year > 0:
-        time = f"{year}y"
-    elif time_elapsed.days > 0:
-        time = f"{time_elapsed.days}d"
-    elif hour > 0:
-        time = f"{hour}h"
-    elif minute > 0:
-        time = f"{minute}m"
-    else:
-        time = f"{time_elapsed.seconds}s"
+        prev_time = _parse_datetime(prev_time)
+    if prev_time.tzinfo is None:
+        prev_time = prev_time.replace(tzinfo=datetime.timezone.utc)
 
-    return time
+    current_time = now or utcnow()
+    elapsed = int((current_time - prev_time).total_seconds())
+
+    for unit_seconds, suffix in _TIME_UNITS:
+        if elapsed >= unit_seconds:
+            return f"{elapsed // unit_seconds}{suffix}"
+
+    return f"{max(elapsed, 0)}s"
+
+
+def _parse_datetime(time_str: str) -> datetime.datetime:
+    """Parse datetime string, which is in iso 8601 format for crane apis."""
+    try:
+        return datetime.datetime.fromisoformat(time_str.replace("Z", "+00:00"))
+    except ValueError:
+        # pylint: disable=import-outside-toplevel
+        from dateutil.parser import parse
+
+        return parse(time_str)
 
 
 def error(err_msg: str, exit_code: int = 1) -> NoReturn:
     """Print error message and exit program."""
-    typer.secho(err_msg, fg=typer.colors.MAGENTA, err=True)
+    stream = sys.stderr
+    if _isatty(stream):
+        typer.secho(err_msg, fg=typer.colors.MAGENTA, err=True)
+    else:
+        _write_plain(stream, err_msg)
     raise typer.Exit(exit_code)
 
 
@@ -72,11 +108,108 @@ def warn(warn_msg: str) -> None:
 
     Does not print warning if suppressed
     """
-    if C.CLIEnv.IGNORE_WARNING in os.environ:
+    if CLIEnv.IGNORE_WARNING in os.environ:
         return
-    typer.secho(warn_msg, fg=typer.colors.YELLOW)
+    stream = sys.stdout
+    if _isatty(stream):
+        typer.secho(warn_msg, fg=typer.colors.YELLOW)
+    else:
+        _write_plain(stream, warn_msg)
 
 
 def info(info_msg: str) -> None:
     """Print info message."""
-    typer.echo(info_msg)
+    stream = sys.stdout
+    if _isatty(stream):
+        typer.echo(info_msg)
+    else:
+        _write_plain(stream, info_msg)
+
+
+class InfoBuffer:
+    """Batch info messages and print them with a single write.
+
+    Pending messages are printed once `max_lines` of them are buffered, and
+    at least every `interval` seconds by a background thread so that slow
+    streams (e.g. followed logs) still show up promptly.
+
+    Args:
+        max_lines (int): number of buffered messages that triggers a flush
+        interval (float): maximum delay in seconds before a message is printed
+
+    """
+
+    def __init__(self, max_lines: int = 64, interval: float = 0.1) -> None:
+        """Initialize."""
+        self._lines: list[str] = []
+        self._max_lines = max_lines
+        self._interval = interval
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flusher = threading.Thread(target=self._flush_periodically, daemon=True)
+
+    def __enter__(self) -> InfoBuffer:
+        """Start periodic flushing."""
+        self._flusher.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Stop periodic flushing and print remaining messages."""
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+
+    def write(self, info_msg: str) -> None:
+        """Buffer an info message."""
+        with self._lock:
+            self._lines.append(info_msg)
+            if len(self._lines) < self._max_lines:
+                return
+        self.flush()
+
+    def flush(self) -> None:
+        """Print buffered messages."""
+        # print under the lock so that concurrent flushes keep message order
+        with self._lock:
+            if not self._lines:
+                return
+            info("\n".join(self._lines))
+            self._lines.clear()
+            # plain writes are not flushed per message
+            sys.stdout.flush()
+
+    def _flush_periodically(self) -> None:
+        while not self._closed.wait(self._interval):
+            self.flush()
+
+
+def _isatty(stream: IO) -> bool:
+    """Return whether the stream is a terminal, checked once per stream object.
+
+    Streams are looked up on each call, so redirecting `sys.stdout` after import
+    takes effect.
+    """
+    cached = _TTY_CACHE.get(id(stream))
+    if cached is not None and cached[0] is stream:
+        return cached[1]
+    isatty = stream.isatty()
+    if len(_TTY_CACHE) >= _TTY_CACHE_SIZE:
+        # e.g. tests capturing output, which replace streams many times
+        _TTY_CACHE.clear()
+    _TTY_CACHE[id(stream)] = (stream, isatty)
+    return isatty
+
+
+def _write_plain(stream: IO, msg: str) -> None:
+    """Write message without ansi styles to a stream that is not a terminal.
+
+    The stream is not flushed, so that many messages share a write.
+    """
+    if "\033" in msg:
+        msg = _ANSI_ESCAPE.sub("", msg)
+    stream.write(f"{msg}\n")
@@ -19,6 +19,6 @@ crane: crane user client interface
 """
 
 
-from crane.cli.user.main import app
+from crane.cli.user.main import app, main
 
-__all__ = ["app"]
+__all__ = ["app", "main"]
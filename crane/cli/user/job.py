@@ -20,7 +20,6 @@ from __future__ import annotations
 import concurrent.futures
 import shlex
 from datetime import datetime
-from itertools import cycle
 from pathlib import Path
 from typing import Any, Iterable, Iterator, List
 
@@ -28,7 +27,14 @@ import typer
 
 import crane.common.constant as C
 from crane.cli.common.cli import check_connection
-from crane.cli.common.display import build_time_delta, error, info, warn
+from crane.cli.common.display import (
+    InfoBuffer,
+    build_time_delta,
+    error,
+    info,
+    utcnow,
+    warn,
+)
 from crane.cli.user.typing import UserClientContext
 from crane.common.api_model import MCInspectResponse
 from crane.common.model import log, mini_cluster
@@ -99,8 +105,13 @@ def list_job(
     """List jobs with given query."""
     client = job_filter.client
 
-    def job_status_iter() -> Iterator[MCInspectResponse]:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+    def job_status_iter(as_completed: bool = False) -> Iterator[MCInspectResponse]:
+        max_workers = min(32, len(jobs))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            if not as_completed:
+                yield from executor.map(client.job.inspect, jobs)
+                return
+
             futures = [executor.submit(client.job.inspect, job_id) for job_id in jobs]
             for future in concurrent.futures.as_completed(futures):
                 yield future.result()
@@ -109,17 +120,19 @@ def list_job(
 
     try:
         jobs = job_filter.filter_jobs(states)
-        sorted_job_status = _sort_job_by_creation(job_status_iter())
-
         if not jobs:
             warn("No jobs found.")
             return
 
         if quiet:
-            for job_status in sorted_job_status:
+            # print names as soon as they arrive, so a slow job does not block others
+            for job_status in job_status_iter(as_completed=True):
                 info(job_status.name)
             return
 
+        # sorted afterwards, so completion order does not matter
+        sorted_job_status = _sort_job_by_creation(job_status_iter())
+
         columns: list[Any] = [
             ("name", str),
             ("tags", List[str]),
@@ -128,7 +141,10 @@ def list_job(
             ("GPU", str),
         ]
 
-        rows = [_build_job_status_row(job_status) for job_status in sorted_job_status]
+        now = utcnow()
+        rows = [
+            _build_job_status_row(job_status, now) for job_status in sorted_job_status
+        ]
 
         info(tabulate_rows(rows, columns))
     except BaseCraneAPIException as e:
@@ -294,29 +310,38 @@ def remove_job(
     You cannot remove a job that is not terminated unless forced.
 
     """
-    # TODO: use executor to delete multiple jobs at once
     client = ctx.obj
 
     terminated_states = ["DONE", "INVALID", "ERROR"]
 
+    def remove(job_id: str, running: bool) -> str:
+        if running:
+            client.job.kill(job_id, force)
+        client.job.delete(job_id)
+        return job_id
+
     try:
         job_list = client.job.filter(id_or_name, tags)
         if not job_list:
             warn("No jobs found.")
             return
 
-        for job_id in job_list:
-            job_status = client.job.inspect(job_id)
-            if job_status.state_history.curr not in terminated_states:
-                if force:
-                    client.job.kill(job_id, force)
-                else:
-                    error(
-                        f"You cannot remove a running job({job_id}). "
-                        "Kill the job or force remove."
-                    )
-            client.job.delete(job_id)
-            info(job_id)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            running = [
+                job_status.state_history.curr not in terminated_states
+                for job_status in executor.map(client.job.inspect, job_list)
+            ]
+            if not force:
+                for job_id, is_running in zip(job_list, running):
+                    if is_running:
+                        error(
+                            f"You cannot remove a running job({job_id}). "
+                            "Kill the job or force remove."
+                        )
+
+            # map yields in submission order, keeping the output stable
+            for job_id in executor.map(remove, job_list, running):
+                info(job_id)
     except BaseCraneAPIException as e:
         error(str(e))
 
@@ -363,28 +388,29 @@ def _print_logs(log_stream: Iterator[log.Log], *, timestamp: bool):
     factory = ColorFactory()
 
     # TODO: container id is too long. find a replacement
-    for log_line in log_stream:
-        log_ = log_line.log.strip()
+    with InfoBuffer() as out:
+        for log_line in log_stream:
+            log_ = log_line.log.strip()
 
-        header = f"{log_line.container_id} | "
-        if timestamp:
-            time_str = log_line.timestamp.strftime("%Y-%m-%d_%H:%M:%S")
-            header = f"{header}{time_str} "
-        header = typer.style(header, fg=factory.get_color(log_line.container_id))
+            header = f"{log_line.container_id} | "
+            if timestamp:
+                time_str = log_line.timestamp.strftime("%Y-%m-%d_%H:%M:%S")
+                header = f"{header}{time_str} "
+            header = typer.style(header, fg=factory.get_color(log_line.container_id))
 
-        if log_line.source == "stderr":
-            log_ = typer.style(log_, fg=typer.colors.RED)
-        info(f"{header}{log_}")
+            if log_line.source == "stderr":
+                log_ = typer.style(log_, fg=typer.colors.RED)
+            out.write(f"{header}{log_}")
 
 
-def _build_job_status_row(job_status: MCInspectResponse) -> tuple:
+def _build_job_status_row(job_status: MCInspectResponse, now: datetime) -> tuple:
     history = job_status.state_history
     state = history.curr
     if state in ("ERROR", "INVALID"):
         state = typer.style(state, typer.colors.BRIGHT_RED)
 
-    created = build_time_delta(history.created)
-    status = f"{state} {build_time_delta(history.timestamp)}"
+    created = build_time_delta(history.created, now)
+    status = f"{state} {build_time_delta(history.timestamp, now)}"
 
     gpu_status = _build_gpu_status(job_status)
     return (job_status.name, job_status.tags, created, status, gpu_status)
@@ -434,13 +460,18 @@ class ColorFactory:
         typer.colors.BRIGHT_WHITE,
     ]
 
+    __slots__ = ("_next_idx", "container_id_to_color")
+
     def __init__(self) -> None:
         """Initialize."""
-        self.iter_color = iter(cycle(self.text_colors))
+        self._next_idx = 0
         self.container_id_to_color: dict[str, str] = {}
 
     def get_color(self, container_id: str) -> str:
         """Return color given container id."""
-        if container_id not in self.container_id_to_color:
-            self.container_id_to_color[container_id] = next(self.iter_color)
-        return self.container_id_to_color[container_id]
+        color = self.container_id_to_color.get(container_id)
+        if color is None:
+            color = self.text_colors[self._next_idx % len(self.text_colors)]
+            self._next_idx += 1
+            self.container_id_to_color[container_id] = color
+        return color
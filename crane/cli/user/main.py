@@ -15,20 +15,67 @@
 
 """Console script for crane_cli."""
 
+from __future__ import annotations
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
 import typer
 
+from crane import __version__
+from crane.cli.common.cli import add_lazy_typer, echo_help_with_cache
 from crane.cli.common.command import add_config_commands
-from crane.cli.user import job, resource, user, workspace
-from crane.cli.user.plugin import register_plugins
-from crane.lib import SyncUserClient
+from crane.cli.user.plugin import PluginHelpGroup, plugin_versions, register_plugins
+from crane.common.constant import LOCAL_CRANE_FOLDER
+
+if TYPE_CHECKING:
+    from crane.lib import SyncUserClient
+
+app = typer.Typer(
+    cls=PluginHelpGroup,
+    help="Crane CLI",
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+
+add_lazy_typer(app, "crane.cli.user.user", name="user", help="user related commands")
+add_lazy_typer(
+    app,
+    "crane.cli.user.resource",
+    name="resource",
+    help="crane resource related commands",
+)
+add_lazy_typer(app, "crane.cli.user.job", name="job", help="job related commands")
+add_lazy_typer(
+    app, "crane.cli.user.workspace", name="ws", help="workspace related commands"
+)
+
 
-app = typer.Typer(context_settings={"help_option_names": ["-h", "--help"]})
+def _load_client_cls() -> type[SyncUserClient]:
+    from crane.lib import SyncUserClient  # pylint: disable=import-outside-toplevel
 
-app.add_typer(user.app, name="user", help="user related commands")
-app.add_typer(resource.app, name="resource", help="crane resource related commands")
-app.add_typer(job.app, name="job", help="job related commands")
-app.add_typer(workspace.app, name="ws", help="workspace related commands")
+    return SyncUserClient
 
-add_config_commands(app, SyncUserClient)
+
+add_config_commands(app, _load_client_cls)
 
 register_plugins(app)
+
+
+def main() -> None:
+    """Run crane cli.
+
+    `crane --help` is served from the help cache.
+    """
+    if sys.argv[1:] in (["-h"], ["--help"]):
+        prog_name = os.path.basename(sys.argv[0])
+        echo_help_with_cache(
+            app,
+            prog_name,
+            __version__,
+            LOCAL_CRANE_FOLDER / "help.cache",
+            plugins=plugin_versions(),
+        )
+        return
+
+    app()
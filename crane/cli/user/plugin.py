@@ -15,31 +15,109 @@
 
 """Crane cli Plugin manager."""
 
-import pkg_resources
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Callable
+
+import click
 import typer
 
+from crane.cli.common.cli import LazyTyperGroup, add_lazy_typer
+from crane.cli.common.display import error
+
+if sys.version_info >= (3, 8):
+    from importlib.metadata import Distribution, EntryPoint, distributions
+else:
+    from importlib_metadata import Distribution, EntryPoint, distributions
+
 CRANE_CLI_PLUGIN_ENTRYPOINT = "cranecli.plugins"
 
 
-def register_plugins(app: typer.Typer) -> None:
-    """Register crane cli plugins to typer app."""
-    plugin_versions = {}
+@lru_cache(maxsize=1)
+def _find_plugins() -> tuple[tuple[EntryPoint, Distribution], ...]:
+    """Return entry points of crane cli plugins with their distributions.
+
+    Entry points are read from distribution metadata only, plugin modules are
+    not imported.
+    """
+    return tuple(
+        (entry_point, dist)
+        for dist in distributions()
+        for entry_point in dist.entry_points
+        if entry_point.group == CRANE_CLI_PLUGIN_ENTRYPOINT
+    )
+
+
+@lru_cache(maxsize=1)
+def plugin_versions() -> str:
+    """Return versions of installed plugins, e.g. "example=0.1.0"."""
+    return ", ".join(f"{ep.name}={dist.version}" for ep, dist in _find_plugins())
 
-    for entry_points in pkg_resources.iter_entry_points(CRANE_CLI_PLUGIN_ENTRYPOINT):
-        plugin_module = entry_points.load()
-        dist = pkg_resources.get_distribution(plugin_module.__package__)
-        plugin_versions[entry_points.name] = dist.version
 
-        app.add_typer(getattr(plugin_module, "app"))
+class PluginHelpGroup(click.Group):
+    """Click group that shows versions of installed plugins in its help.
 
-    version_str = ", ".join(f"{name}={ver}" for name, ver in plugin_versions.items())
+    Plugin versions are read from distribution metadata only when the help is
+    rendered, not on every invocation.
+    """
 
-    if app.registered_callback is None:
+    def format_help_text(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Write help text followed by plugin versions."""
+        formatter.write_paragraph()
+        with formatter.indentation():
+            formatter.write_text(f"{self.help or ''}\tplugins: {plugin_versions()}")
 
-        def _mock():
-            pass
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return subcommand, also resolving plugins by the name of their app.
 
-        app.callback()(_mock)
+        Plugins are registered by entry point name, but used to be named after
+        their typer app (e.g. its callback name). The old names keep working,
+        loading plugins only when no command has the given name.
+        """
+        command = super().get_command(ctx, cmd_name)
+        if command is None:
+            command = self._plugins_by_app_name().get(cmd_name)
+        return command
+
+    def _plugins_by_app_name(self) -> dict[str, click.Command]:
+        plugins = {}
+        for entry_point, _ in _find_plugins():
+            command = self.commands.get(entry_point.name)
+            if not isinstance(command, LazyTyperGroup):
+                continue
+            try:
+                # pylint: disable=protected-access
+                app_name = command._load().name
+            except Exception:  # pylint: disable=broad-except
+                # a broken plugin should not break other commands
+                continue
+            if app_name:
+                plugins.setdefault(app_name, command)
+        return plugins
+
+
+def _plugin_app_loader(entry_point: EntryPoint) -> Callable[[], typer.Typer]:
+    def _load() -> typer.Typer:
+        plugin_app = getattr(entry_point.load(), "app", None)
+        if not isinstance(plugin_app, typer.Typer):
+            error(f"Plugin {entry_point.name} does not define typer app 'app'.")
+        return plugin_app
+
+    return _load
+
+
+def register_plugins(app: typer.Typer) -> None:
+    """Register crane cli plugins to typer app.
 
-    assert app.registered_callback
-    app.registered_callback.callback.__doc__ = f"Crane CLI\tplugins: {version_str}"
+    Each plugin is registered as a sub app named after its entry point, and the
+    plugin module is imported only when its sub app is invoked or its help is
+    listed in the help of the app. Create the app with `PluginHelpGroup` to
+    show plugin versions in its help, and to keep invoking plugins by the name
+    of their typer app, which was the command name before.
+    """
+    for entry_point, _ in _find_plugins():
+        add_lazy_typer(app, _plugin_app_loader(entry_point), name=entry_point.name)
@@ -19,8 +19,10 @@
 from __future__ import annotations
 
 import shlex
-from contextlib import contextmanager
-from typing import Iterator, Optional, TypeVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import TracebackType
+from typing import Any, ContextManager, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel
 from typing_extensions import Literal
@@ -30,13 +32,75 @@ from crane.vendor import async_docker as ad
 
 T = TypeVar("T", bound=BaseModel)
 
+# templates of docker options. each container option gets its own copy, as
+# callers may modify the options of a container
+_EXPOSED_PORT = ad.ExposedPorts()
+_RDMA_CAPABILITIES = ("IPC_LOCK", "SYS_NICE")
+_RDMA_DEVICES = tuple(
+    ad.DeviceMapping(
+        path_on_host=path, path_in_container=path, cgroup_permissions="rwm"
+    )
+    for path in ("/dev/infiniband/uverbs0", "/dev/infiniband/uverbs1")
+)
+
+
+@lru_cache(maxsize=1024)
+def _split_command(cmd: str) -> tuple[str, ...]:
+    """Split command in shell-like syntax. Replicas often share the command."""
+    return tuple(shlex.split(cmd))
+
+
+@lru_cache(maxsize=16)
+def _fluentd_log_template(log_url: str) -> ad.LogConfig:
+    """Return validated log config shared by options. Must not be modified."""
+    return ad.LogConfig(
+        type="fluentd",
+        config={
+            "fluentd-address": log_url,
+            "fluentd-sub-second-precision": "true",
+        },
+    )
+
+
+def _fluentd_log_config(log_url: str) -> ad.LogConfig:
+    """Return log config owned by the caller, copied without validation."""
+    template = _fluentd_log_template(log_url)
+    return template.copy(update={"config": dict(template.config)})
+
+
+@lru_cache(maxsize=128)
+def _health_template(health_cmd: str) -> ad.HealthConfig:
+    """Return validated health config shared by options. Must not be modified."""
+    return ad.HealthConfig(
+        test=list(_split_command(health_cmd)),
+        start_period=5_000_000_000,
+        interval=3_000_000_000,
+        timeout=10_000_000_000,
+        retries=15,
+    )
+
+
+def _health_config(health_cmd: str) -> ad.HealthConfig:
+    """Return health config owned by the caller, copied without validation."""
+    template = _health_template(health_cmd)
+    return template.copy(update={"test": list(template.test)})
+
+
+@lru_cache(maxsize=64)
+def _crane_labels(role: str | None) -> tuple[tuple[str, str], ...]:
+    """Return crane specific labels as immutable items.
+
+    Roles are a small fixed set, so the items are cached and each docker option
+    gets its own dict built from them.
+    """
+    if role:
+        return (("crane", "true"), ("role", role))
+    return (("crane", "true"),)
+
 
 def add_crane_label(obj: T, role: str | None = None) -> T:
     """Add crane specific label to docker option."""
-    labels = dict(crane="true")
-    if role:
-        labels["role"] = role
-    return add_label(obj, labels)
+    return add_label(obj, dict(_crane_labels(role)))
 
 
 def add_label(obj: T, labels: dict[str, str]) -> T:
@@ -48,7 +112,8 @@ def local_volume(
     name: str, opts: Optional[dict[str, str]] = None
 ) -> ad.VolumesCreatePostRequest:
     """Create a local volume option."""
-    return ad.VolumesCreatePostRequest(
+    # options are created by crane, thus skip validation
+    return ad.VolumesCreatePostRequest.construct(
         name=name, driver="local", driver_opts=opts or {}
     )
 
@@ -60,7 +125,7 @@ def overlay(name: str) -> ad.NetworksCreatePostRequest:
         name (str): name of the overlay network
 
     """
-    return ad.NetworksCreatePostRequest(
+    return ad.NetworksCreatePostRequest.construct(
         name=name,
         driver="overlay",
         check_duplicate=True,
@@ -72,24 +137,49 @@ def overlay(name: str) -> ad.NetworksCreatePostRequest:
 def network_attach_option(alias_config: dict[str, list[str]]) -> ad.NetworkingConfig:
     """Create networking configuration from network name to aliases mapping."""
     endpoints_config = {
-        name: ad.EndpointsConfig(__root__=ad.EndpointSettings(aliases=aliases))
+        name: ad.EndpointsConfig.construct(
+            __root__=ad.EndpointSettings.construct(aliases=aliases)
+        )
         for name, aliases in alias_config.items()
     }
-    return ad.NetworkingConfig(endpoints_config=endpoints_config)
+    return ad.NetworkingConfig.construct(endpoints_config=endpoints_config)
+
+
+class _SuppressNoDockerEntity:
+    """Ignore docker errors that correspond to 404. Stateless, thus shared."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
 
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> bool:
+        return isinstance(exc, ad.DockerHTTPError) and exc.status_code == 404
+
+
+_SUPPRESS_NO_DOCKER_ENTITY = _SuppressNoDockerEntity()
 
-@contextmanager
-def suppress_no_docker_entity() -> Iterator[None]:
+
+def suppress_no_docker_entity() -> ContextManager[None]:
     """A context manager for ignoring docker errors that correspond to 404."""
-    try:
-        yield
-    except ad.DockerHTTPError as e:
-        if e.status_code != 404:
-            raise
+    return _SUPPRESS_NO_DOCKER_ENTITY
 
 
 class ContainerOption(ad.ContainersCreatePostRequest):
-    """Container configuration."""
+    """Container configuration.
+
+    Each setter returns a new container option. To apply several settings at
+    once, use `builder()` which creates the new option only once.
+    """
+
+    def builder(self) -> ContainerOptionBuilder:
+        """Return a mutable builder initialized with this option."""
+        return ContainerOptionBuilder.from_option(self)
 
     def set_image(self, image: str) -> ContainerOption:
         """Configure container image option.
@@ -101,7 +191,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        return self.copy(update={"image": image})
+        return self.builder().set_image(image).build()
 
     def set_process(
         self, cmd: str | None, user: str | None = None, init: bool = False
@@ -117,17 +207,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        host_config = self.host_config or ad.HostConfig()
-        host_config = host_config.copy(update={"init": init})
-
-        update: dict[str, object] = {"host_config": host_config}
-        if cmd:
-            update["cmd"] = shlex.split(cmd)
-
-        if user:
-            update["user"] = user
-
-        return self.copy(update=update)
+        return self.builder().set_process(cmd, user, init).build()
 
     def set_envs(self, envs: dict[str, str]) -> ContainerOption:
         """Configure container environment variables.
@@ -139,8 +219,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        env = [f"{k}={v}" for k, v in envs.items()] + (self.env or [])
-        return self.copy(update={"env": env})
+        return self.builder().set_envs(envs).build()
 
     def set_storage(self, *mounts: container.MountMapping) -> ContainerOption:
         """Configure container file_system option.
@@ -152,13 +231,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        host_config = self.host_config or ad.HostConfig()
-
-        binds = [f"{m.host_dir}:{m.container_dir}:{m.mode}" for m in mounts]
-        binds += host_config.binds or []
-        host_config = host_config.copy(update={"binds": binds})
-
-        return self.copy(update={"host_config": host_config})
+        return self.builder().set_storage(*mounts).build()
 
     def set_ports(self, *ports: container.PortMapping) -> ContainerOption:
         """Configure container port forwarding.
@@ -170,26 +243,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        host_config = self.host_config or ad.HostConfig()
-
-        exposed_ports = dict(self.exposed_ports or {})
-        port_bindings = dict(host_config.port_bindings or {})
-        for p in ports:
-            container_port = f"{p.container_port}/{p.transport}"
-            host_info = dict(HostPort=str(p.host_port), HostIp=p.host_ip)
-
-            exposed_ports[container_port] = ad.ExposedPorts()
-
-            if container_port not in port_bindings:
-                port_bindings[container_port] = []
-
-            port_bindings[container_port].append(host_info)
-
-        host_config = host_config.copy(update={"port_bindings": port_bindings})
-
-        return self.copy(
-            update={"host_config": host_config, "exposed_ports": exposed_ports}
-        )
+        return self.builder().set_ports(*ports).build()
 
     def set_network(
         self,
@@ -208,53 +262,11 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        endpoints_config = (
-            self.networking_config and self.networking_config.endpoints_config or {}
-        )
-        if networks:
-            endpoints_config.update(networks.endpoints_config or {})
-            # todo: docker engine only allow one endpoint config at startup.
-            #       networks other than one should be attached via network connect
-        networking_config = ad.NetworkingConfig(endpoints_config=endpoints_config)
-
-        updates: dict[str, object] = {"networking_config": networking_config}
-
-        if hostname:
-            updates["hostname"] = hostname
-
-        host_config = self.host_config or ad.HostConfig()
-
-        if rdma:
-            cap_add = host_config.cap_add or []
-            cap_add = cap_add + ["IPC_LOCK", "SYS_NICE"]
-
-            devices = host_config.devices or []
-            devices = devices + [
-                ad.DeviceMapping(
-                    path_on_host="/dev/infiniband/uverbs0",
-                    path_in_container="/dev/infiniband/uverbs0",
-                    cgroup_permissions="rwm",
-                ),
-                ad.DeviceMapping(
-                    path_on_host="/dev/infiniband/uverbs1",
-                    path_in_container="/dev/infiniband/uverbs1",
-                    cgroup_permissions="rwm",
-                ),
-            ]
-            host_config = host_config.copy(
-                update={"cap_add": cap_add, "devices": devices}
-            )
-            updates["host_config"] = host_config
-        return self.copy(update=updates)
+        return self.builder().set_network(networks, hostname, rdma).build()
 
     def set_cap(self, *capabilities: str) -> ContainerOption:
         """Add capabilities."""
-        host_config = self.host_config or ad.HostConfig()
-        cap_add = host_config.cap_add or []
-        cap_add.extend(capabilities)
-
-        host_config = host_config.copy(update={"cap_add": cap_add})
-        return self.copy(update={"host_config": host_config})
+        return self.builder().set_cap(*capabilities).build()
 
     def set_host(self, shm_size: int) -> ContainerOption:
         """Configure container host option.
@@ -266,9 +278,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        host_config = self.host_config or ad.HostConfig()
-        host_config = host_config.copy(update={"shm_size": shm_size})
-        return self.copy(update={"host_config": host_config})
+        return self.builder().set_host(shm_size).build()
 
     def set_runtime(
         self, pid_host: bool, health_cmd: str | None, log_url: str | None
@@ -284,35 +294,7 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
-        host_config = self.host_config or ad.HostConfig()
-        host_updates: dict[str, object] = {}
-
-        if pid_host:
-            host_updates["pid_host"] = "host"
-
-        if log_url:
-            host_updates["log_config"] = ad.LogConfig(
-                type="fluentd",
-                config={
-                    "fluentd-address": log_url,
-                    "fluentd-sub-second-precision": "true",
-                },
-            )
-
-        host_config = host_config.copy(update=host_updates)
-        update: dict[str, object] = {"host_config": host_config}
-
-        if health_cmd is not None:
-            health_config = ad.HealthConfig(
-                test=shlex.split(health_cmd),
-                start_period=5_000_000_000,
-                interval=3_000_000_000,
-                timeout=10_000_000_000,
-                retries=15,
-            )
-            update["healthcheck"] = health_config
-
-        return self.copy(update=update)
+        return self.builder().set_runtime(pid_host, health_cmd, log_url).build()
 
     def set_exit(
         self,
@@ -332,24 +314,315 @@ class ContainerOption(ad.ContainersCreatePostRequest):
             ContainerOption: self
 
         """
+        return (
+            self.builder()
+            .set_exit(
+                auto_remove=auto_remove,
+                restart_policy=restart_policy,
+                maximum_retry=maximum_retry,
+            )
+            .build()
+        )
+
+    # pylint: disable=too-many-arguments,too-many-locals
+    def configure(
+        self,
+        *,
+        image: str,
+        cmd: str | None = None,
+        user: str | None = None,
+        init: bool = False,
+        envs: dict[str, str] | None = None,
+        mounts: Sequence[container.MountMapping] = (),
+        ports: Sequence[container.PortMapping] = (),
+        networks: ad.NetworkingConfig | None = None,
+        hostname: str | None = None,
+        rdma: bool = False,
+        shm_size: int | None = None,
+        pid_host: bool = False,
+        health_cmd: str | None = None,
+        log_url: str | None = None,
+        auto_remove: bool = False,
+        restart_policy: Literal["", "always", "unless-stopped", "on-failure"] = "",
+        maximum_retry: int | None = None,
+    ) -> ContainerOption:
+        """Configure container options at once.
+
+        Equivalent to chaining `set_image`, `set_process`, `set_envs`,
+        `set_storage`, `set_ports`, `set_network`, `set_host` (if shm_size is
+        given), `set_runtime` and `set_exit`, but creates the option only once.
+        See each setter for the arguments.
+
+        Returns:
+            ContainerOption: self
+
+        """
+        builder = (
+            self.builder()
+            .set_image(image)
+            .set_process(cmd, user, init)
+            .set_envs(envs or {})
+            .set_storage(*mounts)
+            .set_ports(*ports)
+            .set_network(networks, hostname, rdma)
+        )
+        if shm_size is not None:
+            builder.set_host(shm_size)
+
+        return (
+            builder.set_runtime(pid_host, health_cmd, log_url)
+            .set_exit(
+                auto_remove=auto_remove,
+                restart_policy=restart_policy,
+                maximum_retry=maximum_retry,
+            )
+            .build()
+        )
+
+    def replicate(
+        self, *ports: container.PortMapping, hostname: str | None = None
+    ) -> ContainerOption:
+        """Create an option of a replica from this option as a template.
+
+        Replicas share most of the options. Configure the template once, and set
+        only the per-replica hostname and ports on each replica.
+
+        Args:
+            ports (list[container.PortMapping]): ports of the replica
+            hostname (str | None): hostname of the replica
+
+        Returns:
+            ContainerOption: option of the replica
+
+        """
+        builder = self.builder().set_ports(*ports)
+        if hostname:
+            builder.set_hostname(hostname)
+        return builder.build()
+
+
+def _shallow_copy(value: Any) -> Any:
+    """Copy lists and dicts so that the builder can update them in place."""
+    if isinstance(value, list):
+        return list(value)
+    if isinstance(value, dict):
+        return dict(value)
+    return value
+
+
+def _set_fields(model: BaseModel) -> dict[str, Any]:
+    """Return fields explicitly set on the model."""
+    return {name: _shallow_copy(getattr(model, name)) for name in model.__fields_set__}
+
+
+def _list_field(fields: dict[str, Any], name: str) -> list:
+    """Return list field to extend in place, setting an empty list if not set.
+
+    Lists in builder fields are owned by the builder (see `_shallow_copy`).
+    """
+    value = fields.get(name)
+    if value is None:
+        value = fields[name] = []
+    return value
+
+
+def _endpoints_config(networks: ad.NetworkingConfig | None) -> dict[str, Any]:
+    """Return endpoints config of networking config."""
+    if networks is None:
+        return {}
+    return networks.endpoints_config or {}
+
+
+@dataclass
+class ContainerOptionBuilder:
+    """Mutable builder of `ContainerOption`.
+
+    Setters update the builder in place and return the builder, and
+    `build` creates the container option and its host config only once.
+    Values are set without validation as they are created by crane.
+    See `ContainerOption` for the description of each setter.
+
+    >>> option = (
+            ContainerOptionBuilder()
+            .set_image("ubuntu:latest")
+            .set_process("sleep 10")
+            .set_exit(auto_remove=True)
+            .build()
+        )
+
+    Attributes:
+        fields (dict[str, Any]): fields of the container option, except host config
+        host_fields (dict[str, Any] | None): fields of the host config.
+            None if the host config is not set.
+
+    """
+
+    fields: dict[str, Any] = field(default_factory=dict)
+    host_fields: dict[str, Any] | None = None
+
+    @classmethod
+    def from_option(cls, option: ContainerOption) -> ContainerOptionBuilder:
+        """Create a builder initialized with fields set on the option."""
+        fields = _set_fields(option)
+        host_config = fields.pop("host_config", None)
+        host_fields = None if host_config is None else _set_fields(host_config)
+
+        # port binding lists are appended in place by `set_ports`
+        port_bindings = host_fields and host_fields.get("port_bindings")
+        if port_bindings:
+            host_fields["port_bindings"] = {
+                port: list(bindings) for port, bindings in port_bindings.items()
+            }
+
+        return cls(fields, host_fields)
+
+    def build(self) -> ContainerOption:
+        """Create the container option."""
+        fields = dict(self.fields)
+        if self.host_fields is not None:
+            fields["host_config"] = ad.HostConfig.construct(**self.host_fields)
+        return ContainerOption.construct(**fields)
+
+    def _host(self) -> dict[str, Any]:
+        """Return fields of the host config, setting an empty one if not set."""
+        if self.host_fields is None:
+            self.host_fields = {}
+        return self.host_fields
+
+    def set_image(self, image: str) -> ContainerOptionBuilder:
+        """Configure container image option."""
+        self.fields["image"] = image
+        return self
+
+    def set_process(
+        self, cmd: str | None, user: str | None = None, init: bool = False
+    ) -> ContainerOptionBuilder:
+        """Configure container process option."""
+        self._host()["init"] = init
+        if cmd:
+            self.fields["cmd"] = list(_split_command(cmd))
+
+        if user:
+            self.fields["user"] = user
+
+        return self
+
+    def set_envs(self, envs: dict[str, str]) -> ContainerOptionBuilder:
+        """Configure container environment variables."""
+        env = [f"{k}={v}" for k, v in envs.items()]
+        env.extend(self.fields.get("env") or ())
+        self.fields["env"] = env
+        return self
+
+    def set_storage(self, *mounts: container.MountMapping) -> ContainerOptionBuilder:
+        """Configure container file_system option."""
+        host = self._host()
+        binds = container.MountMapping.bind_strings(mounts)
+        binds.extend(host.get("binds") or ())
+        host["binds"] = binds
+        return self
+
+    def set_ports(self, *ports: container.PortMapping) -> ContainerOptionBuilder:
+        """Configure container port forwarding."""
+        host = self._host()
+        exposed_ports = self.fields.get("exposed_ports") or {}
+        port_bindings = host.get("port_bindings") or {}
+        grouped = container.PortMapping.group_bindings(ports)
+        for container_port, bindings in grouped.items():
+            exposed_ports.setdefault(container_port, _EXPOSED_PORT.copy())
+            port_bindings.setdefault(container_port, []).extend(bindings)
+
+        self.fields["exposed_ports"] = exposed_ports
+        host["port_bindings"] = port_bindings
+        return self
+
+    def set_network(
+        self,
+        networks: ad.NetworkingConfig | None = None,
+        hostname: str | None = None,
+        rdma: bool = False,
+    ) -> ContainerOptionBuilder:
+        """Configure container network option."""
+        endpoints_config = dict(_endpoints_config(self.fields.get("networking_config")))
+        if networks:
+            endpoints_config.update(_endpoints_config(networks))
+            # todo: docker engine only allow one endpoint config at startup.
+            #       networks other than one should be attached via network connect
+        self.fields["networking_config"] = ad.NetworkingConfig.construct(
+            endpoints_config=endpoints_config
+        )
+
+        if hostname:
+            self.set_hostname(hostname)
+
+        if rdma:
+            host = self._host()
+            _list_field(host, "cap_add").extend(_RDMA_CAPABILITIES)
+            _list_field(host, "devices").extend(d.copy() for d in _RDMA_DEVICES)
+        return self
+
+    def set_hostname(self, hostname: str) -> ContainerOptionBuilder:
+        """Configure container hostname."""
+        self.fields["hostname"] = hostname
+        return self
+
+    def set_cap(self, *capabilities: str) -> ContainerOptionBuilder:
+        """Add capabilities."""
+        _list_field(self._host(), "cap_add").extend(capabilities)
+        return self
+
+    def set_host(self, shm_size: int) -> ContainerOptionBuilder:
+        """Configure container host option."""
+        self._host()["shm_size"] = shm_size
+        return self
+
+    def set_runtime(
+        self, pid_host: bool, health_cmd: str | None, log_url: str | None
+    ) -> ContainerOptionBuilder:
+        """Configure container runtime option."""
+        host = self._host()
+
+        if pid_host:
+            host["pid_host"] = "host"
+
+        if log_url:
+            host["log_config"] = _fluentd_log_config(log_url)
+
+        if health_cmd is not None:
+            self.fields["healthcheck"] = _health_config(health_cmd)
+
+        return self
+
+    def set_exit(
+        self,
+        *,
+        auto_remove: bool = False,
+        restart_policy: Literal["", "always", "unless-stopped", "on-failure"] = "",
+        maximum_retry: int | None = None,
+    ) -> ContainerOptionBuilder:
+        """Configure container removal option."""
         if restart_policy != "on-failure" and maximum_retry is not None:
             raise ValueError(
                 f"maximum_retry is not supported for restart policy {restart_policy}"
             )
 
-        host_config = self.host_config or ad.HostConfig()
+        host = self._host()
 
-        policy = host_config.restart_policy or ad.RestartPolicy()
+        policy_updates: dict[str, object] = {}
         if restart_policy:
-            policy = policy.copy(update={"name": restart_policy})
+            policy_updates["name"] = restart_policy
 
         if maximum_retry:
-            policy = policy.copy(update={"maximum_retry_count": maximum_retry})
+            policy_updates["maximum_retry_count"] = maximum_retry
 
-        host_updates: dict[str, object] = {"restart_policy": policy}
+        # keep the current restart policy as is if there is nothing to update
+        policy = host.get("restart_policy")
+        if policy is None:
+            host["restart_policy"] = ad.RestartPolicy.construct(**policy_updates)
+        elif policy_updates:
+            host["restart_policy"] = policy.copy(update=policy_updates)
 
         if auto_remove:
-            host_updates["auto_remove"] = True
+            host["auto_remove"] = True
 
-        host_config = host_config.copy(update=host_updates)
-        return self.copy(update={"host_config": host_config})
+        return self
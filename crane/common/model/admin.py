@@ -23,11 +23,15 @@ from typing import List, Optional
 
 from crane.common.api_model import user
 from crane.common.model import dataclass, resource
-from crane.common.util.serialization import DataClassJSONMixin, DataClassYAMLMixin
+from crane.common.util.serialization import (
+    CachedSerializeMixin,
+    DataClassJSONMixin,
+    DataClassYAMLMixin,
+)
 
 
-@dataclass
-class NodeStatus(DataClassJSONMixin):
+@dataclass(frozen=True)
+class NodeStatus(CachedSerializeMixin, DataClassJSONMixin):
     """Crane node status.
 
     Args:
@@ -46,7 +50,7 @@ class NodeStatus(DataClassJSONMixin):
     role: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class SwarmToken(DataClassJSONMixin):
     """Token from docker swarm.
 
@@ -60,8 +64,8 @@ class SwarmToken(DataClassJSONMixin):
     worker: str
 
 
-@dataclass
-class ClusterStatus(DataClassJSONMixin, DataClassYAMLMixin):
+@dataclass(frozen=True)
+class ClusterStatus(CachedSerializeMixin, DataClassJSONMixin, DataClassYAMLMixin):
     """Cluster status.
 
     Args:
@@ -74,7 +78,7 @@ class ClusterStatus(DataClassJSONMixin, DataClassYAMLMixin):
     token: SwarmToken
 
 
-@dataclass
+@dataclass(frozen=True)
 class DevConfig(DataClassJSONMixin):
     """Configuration used only in development.
 
@@ -91,7 +95,7 @@ class DevConfig(DataClassJSONMixin):
     local_crane_path: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class NodeConfig(DataClassJSONMixin):
     """Configuration for each node.
 
@@ -109,7 +113,7 @@ class NodeConfig(DataClassJSONMixin):
     log_port: int = 54321
 
 
-@dataclass
+@dataclass(frozen=True)
 class SkipConfig(DataClassJSONMixin):
     """Flag for skipping components."""
 
@@ -151,7 +155,7 @@ class JoinCluster(DataClassJSONMixin):
     gateway_port: int = 8000
 
 
-@dataclass
+@dataclass(frozen=True)
 class InstallConfig(DataClassJSONMixin):
     """Configuration to install crane.
 
@@ -163,7 +167,7 @@ class InstallConfig(DataClassJSONMixin):
     version: str
 
 
-@dataclass
+@dataclass(frozen=True)
 class LeaveConfig(DataClassJSONMixin):
     """Configuration to leave the cluster.
 
@@ -178,7 +182,7 @@ class LeaveConfig(DataClassJSONMixin):
     persist: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class NodeUpdateConfig(DataClassJSONMixin):
     """Configuration for node promote and demote.
 
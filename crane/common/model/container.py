@@ -36,6 +36,7 @@ SystemSide: this include configurations that cannot be chosen by user,
 
 from __future__ import annotations
 
+import sys
 from dataclasses import field, replace
 from typing import Dict, List, Optional, Sequence
 
@@ -113,6 +114,11 @@ class MountMapping(DataClassJSONSerializeMixin):
     container_dir: str
     mode: str = field(default="rw")
 
+    @staticmethod
+    def bind_strings(mounts: Sequence[MountMapping]) -> list[str]:
+        """Format mounts as docker bind strings, `host_dir:container_dir:mode`."""
+        return [f"{m.host_dir}:{m.container_dir}:{m.mode}" for m in mounts]
+
 
 @dataclass
 class Storage(DataClassJSONSerializeMixin):
@@ -247,6 +253,28 @@ class PortMapping(DataClassJSONSerializeMixin):
     host_ip: str
     transport: str = "tcp"
 
+    @staticmethod
+    def group_bindings(
+        ports: Sequence[PortMapping],
+    ) -> dict[str, list[dict[str, str]]]:
+        """Group docker port bindings by container port, `container_port/transport`.
+
+        Args:
+            ports (Sequence[PortMapping]): port mappings
+
+        Returns:
+            dict[str, list[dict[str, str]]]: container port to host port bindings
+
+        """
+        bindings: dict[str, list[dict[str, str]]] = {}
+        for p in ports:
+            # the same container ports recur across replicas
+            port = sys.intern(f"{p.container_port}/{p.transport}")
+            bindings.setdefault(port, []).append(
+                {"HostPort": str(p.host_port), "HostIp": p.host_ip}
+            )
+        return bindings
+
 
 @dataclass
 class KillOption(DataClassJSONSerializeMixin):
@@ -304,7 +332,8 @@ class State(state.State):
         return State.DOWN
 
 
-@dataclass(frozen=True)
+# eq=False keeps the equality and the cached hash of the base history
+@dataclass(frozen=True, eq=False)
 class StateHistory(state.StateHistory[State]):
     """Container state history."""
 
@@ -15,6 +15,7 @@
 
 """Log models."""
 
+import time
 from dataclasses import field
 from datetime import datetime
 from enum import Enum
@@ -24,6 +25,25 @@ from crane.common.model import dataclass
 from crane.common.util.serialization import DataClassJSONMixin
 
 
+# timestamps of logs created within this interval (in seconds) share a clock read
+_CLOCK_RESOLUTION = 0.001
+# (monotonic tick, utc time) of the last clock read, replaced as a whole so that
+# concurrent readers never see a tick paired with another read's time
+_last_read = (float("-inf"), datetime.min)
+
+
+def _coarse_utcnow() -> datetime:
+    """Return current UTC time, read from the clock at most once per resolution."""
+    global _last_read  # pylint: disable=global-statement
+    tick = time.monotonic()
+    last_tick, last_now = _last_read
+    if tick - last_tick < _CLOCK_RESOLUTION:
+        return last_now
+    now = datetime.utcnow()
+    _last_read = (tick, now)
+    return now
+
+
 class LogSource(str, Enum):
     """Source of log.
 
@@ -36,7 +56,7 @@ class LogSource(str, Enum):
     STDOUT = "stdout"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Log(DataClassJSONMixin):
     """Log model.
 
@@ -51,7 +71,7 @@ class Log(DataClassJSONMixin):
     container_id: str
     source: LogSource
     log: str
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp: datetime = field(default_factory=_coarse_utcnow)
 
 
 @dataclass(frozen=True, eq=True)
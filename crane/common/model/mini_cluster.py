@@ -69,7 +69,8 @@ class State(state.State):
         return State.QUEUED
 
 
-@dataclass(frozen=True)
+# eq=False keeps the equality and the cached hash of the base history
+@dataclass(frozen=True, eq=False)
 class StateHistory(state.StateHistory[State]):
     """Mini cluster state history."""
 
@@ -40,6 +40,9 @@ class LogicalAllocationCluster(
 
     resources: Mapping[str, LogicalAllocation]
 
+    # resources may be reassigned, so the cached hash of groups would go stale
+    __hash__ = None  # type: ignore
+
 
 @dataclass(eq=False, init=False, order=False)
 class PhysicalAllocationCluster(
@@ -50,3 +53,6 @@ class PhysicalAllocationCluster(
     """A group of physical allocated resources."""
 
     resources: Mapping[str, PhysicalAllocation]
+
+    # resources may be reassigned, so the cached hash of groups would go stale
+    __hash__ = None  # type: ignore
@@ -22,7 +22,9 @@ Physical: gpu_indices (Set[int])
 
 from __future__ import annotations
 
-from typing import FrozenSet, Iterable
+import sys
+from functools import lru_cache
+from typing import Any, FrozenSet, Iterable
 
 from crane.common.model import dataclass
 from crane.common.model.resource.typing import LogicalInterface, PhysicalInterface
@@ -47,18 +49,29 @@ class Logical(LogicalInterface, DataClassJSONSerializeMixin):
         if self.num_gpu < 0:
             raise ValueError("'num_gpu' must be non-negative integer.")
 
+    @classmethod
+    def _intern(cls, num_gpu: int) -> Logical:
+        """Return a logical resource, shared if the number of GPUs is small."""
+        if 0 <= num_gpu < len(_LOGICAL_CACHE):
+            return _LOGICAL_CACHE[num_gpu]
+        return cls(num_gpu)
+
     @classmethod
     def empty(cls) -> Logical:
         """Empty logical resource unit."""
-        return cls(num_gpu=0)
+        return cls._intern(0)
+
+    @classmethod
+    def sum(cls, *resources: Logical) -> Logical:
+        """Reduces list of resources to a single aggregated resource."""
+        return cls._intern(sum(r.num_gpu for r in resources))
 
     def __add__(self, other: Logical) -> Logical:
         """Add two physical resources."""
         if not isinstance(other, Logical):
             return NotImplemented
 
-        new_num_gpu = self.num_gpu + other.num_gpu
-        return Logical(new_num_gpu)
+        return Logical._intern(self.num_gpu + other.num_gpu)
 
     def __sub__(self, other: Logical) -> Logical:
         """Subtract two physical resources."""
@@ -69,7 +82,7 @@ class Logical(LogicalInterface, DataClassJSONSerializeMixin):
         if new_num_gpu < 0:
             raise ValueError("GPU count cannot be negative.")
 
-        return Logical(new_num_gpu)
+        return Logical._intern(new_num_gpu)
 
     def __bool__(self) -> bool:
         """Return True if the resource is empty."""
@@ -92,31 +105,110 @@ class Logical(LogicalInterface, DataClassJSONSerializeMixin):
 
     def __eq__(self, other: object) -> bool:
         """Check if one contains another."""
+        if self is other:
+            return True
         if not isinstance(other, Logical):
             return NotImplemented
 
         return self.num_gpu == other.num_gpu
 
+    def __hash__(self) -> int:
+        """Hash of the number of GPUs."""
+        return hash(self.num_gpu)
+
+
+# logical resources are immutable, thus ones with a few GPUs are shared
+_LOGICAL_CACHE = tuple(Logical(num_gpu) for num_gpu in range(65))
+
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+
+    def _popcount(mask: int) -> int:
+        """Return the number of set bits."""
+        return bin(mask).count("1")
+
+
+def _to_mask(gpu_indices: Iterable[int]) -> int:
+    """Pack GPU indices into a bitmap, where bit i is set if GPU i is included.
+
+    Raises:
+        ValueError: if a GPU index is not a non-negative integer
+
+    """
+    mask = 0
+    for index in gpu_indices:
+        if not isinstance(index, int) or isinstance(index, bool) or index < 0:
+            raise ValueError(f"Invalid GPU index: {index!r}")
+        mask |= 1 << index
+    return mask
+
+
+def _to_indices(mask: int) -> FrozenSet[int]:
+    """Unpack a bitmap into GPU indices."""
+    return frozenset(i for i in range(mask.bit_length()) if mask >> i & 1)
+
 
 @dataclass(frozen=True, eq=False, init=False)
 class Physical(PhysicalInterface[Logical], DataClassJSONSerializeMixin):
     """Represent a unit of physical resource.
 
+    GPU indices are kept as a bitmap so that set operations are integer
+    operations. `gpu_indices` is created from the bitmap on first access.
+
     Args:
         gpu_indices (Iterable[int]): GPU indices
 
+    Raises:
+        ValueError: if a GPU index is not a non-negative integer
+
     """
 
     gpu_indices: FrozenSet[int]
 
     def __init__(self, gpu_indices: Iterable[int]) -> None:
         """Initialize."""
-        object.__setattr__(self, "gpu_indices", frozenset(gpu_indices))
+        gpu_indices = frozenset(gpu_indices)
+        object.__setattr__(self, "gpu_indices", gpu_indices)
+        object.__setattr__(self, "_mask", _to_mask(gpu_indices))
+
+    @classmethod
+    def _from_mask(cls, mask: int) -> Physical:
+        """Create a physical resource from a bitmap of GPU indices."""
+        physical = cls.__new__(cls)
+        object.__setattr__(physical, "_mask", mask)
+        return physical
+
+    def __getattr__(self, name: str) -> Any:
+        """Create `gpu_indices` from the bitmap if not created yet."""
+        if name != "gpu_indices":
+            raise AttributeError(name)
+
+        gpu_indices = _to_indices(self._mask)
+        object.__setattr__(self, "gpu_indices", gpu_indices)
+        return gpu_indices
 
     @classmethod
+    @lru_cache(maxsize=None)
     def empty(cls) -> Physical:
-        """Empty physical resource unit."""
-        return cls(gpu_indices=frozenset())
+        """Empty physical resource unit, shared as it is immutable."""
+        return cls._from_mask(0)
+
+    @classmethod
+    def sum(cls, *resources: Physical) -> Physical:
+        """Reduces list of resources to a single aggregated resource.
+
+        Raises:
+            ValueError: if two physical resources have the same GPU
+
+        """
+        mask = 0
+        for resource in resources:
+            if mask & resource._mask:
+                raise ValueError("Two physical resources have the same GPU")
+            mask |= resource._mask
+        return cls._from_mask(mask)
 
     def as_logical(self) -> Logical:
         """Return a logical resource that reflect this physical resource.
@@ -125,8 +217,8 @@ class Physical(PhysicalInterface[Logical], DataClassJSONSerializeMixin):
             Logical: A logical resource
 
         """
-        num_gpu = len(self.gpu_indices)
-        return Logical(num_gpu)
+        num_gpu = _popcount(self._mask)
+        return Logical._intern(num_gpu)
 
     def is_subset(self, other: Physical) -> bool:
         """Return true if the given resource is a subset of this group."""
@@ -137,47 +229,49 @@ class Physical(PhysicalInterface[Logical], DataClassJSONSerializeMixin):
         if not isinstance(other, Physical):
             return NotImplemented
 
-        if self.gpu_indices.intersection(other.gpu_indices):
+        if self._mask & other._mask:
             raise ValueError("Two physical resources have the same GPU")
 
-        new_gpu_indices = self.gpu_indices.union(other.gpu_indices)
-        return Physical(new_gpu_indices)
+        return Physical._from_mask(self._mask | other._mask)
 
     def __sub__(self, other: Physical) -> Physical:
         """Subtract two physical resources."""
         if not isinstance(other, Physical):
             return NotImplemented
 
-        if not self.gpu_indices.issuperset(other.gpu_indices):
+        if other._mask & ~self._mask:
             raise ValueError("Invalid gpu_indices.")
 
-        new_gpu_indices = self.gpu_indices.difference(other.gpu_indices)
-        return Physical(new_gpu_indices)
+        return Physical._from_mask(self._mask & ~other._mask)
 
     def __bool__(self) -> bool:
         """Return True if the resource is empty."""
-        return bool(self.gpu_indices)
+        return self._mask != 0
 
     def __lt__(self, other: Physical) -> bool:
         """Returns if a physical resource is subset of this."""
         if not isinstance(other, Physical):
             return NotImplemented
 
-        return self.gpu_indices < other.gpu_indices
+        return self._mask != other._mask and self._mask & other._mask == self._mask
 
     def __gt__(self, other: Physical) -> bool:
         """Returns if a physical resource is superset of this."""
         if not isinstance(other, Physical):
             return NotImplemented
 
-        return self.gpu_indices > other.gpu_indices
+        return self._mask != other._mask and self._mask & other._mask == other._mask
 
     def __eq__(self, other: object) -> bool:
         """Returns if a physical resource is subset of this."""
         if not isinstance(other, Physical):
             return NotImplemented
 
-        return self.gpu_indices == other.gpu_indices
+        return self._mask == other._mask
+
+    def __hash__(self) -> int:
+        """Hash of the bitmap."""
+        return hash(self._mask)
 
     def __and__(self, other: Physical) -> Physical:
         """Returns a intersection of two physical resources.
@@ -189,5 +283,7 @@ class Physical(PhysicalInterface[Logical], DataClassJSONSerializeMixin):
             Physical: common physical resource
 
         """
-        new_gpu_indices = self.gpu_indices.intersection(other.gpu_indices)
-        return Physical(gpu_indices=new_gpu_indices)
+        if not isinstance(other, Physical):
+            return NotImplemented
+
+        return Physical._from_mask(self._mask & other._mask)
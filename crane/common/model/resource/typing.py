@@ -18,11 +18,9 @@
 from __future__ import annotations
 
 import abc
-from collections import defaultdict
-from itertools import chain
+from functools import lru_cache
 from typing import (
     ClassVar,
-    DefaultDict,
     Generic,
     Hashable,
     Iterator,
@@ -32,7 +30,6 @@ from typing import (
 )
 
 from crane.common.util.generic import GenericArgsHookMixin
-from crane.common.util.itertools import value_map
 
 R = TypeVar("R", bound="ResourceInterface")
 A = TypeVar("A", bound="AbstractAllocation")
@@ -247,9 +244,10 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
     resources: Mapping[K, R]
 
     @classmethod
+    @lru_cache(maxsize=None)
     def empty(cls: type[G]) -> G:
-        """Empty resource group."""
-        return cls()
+        """Empty resource group, shared as it is immutable."""
+        return cls._unchecked({})
 
     def __init__(self, resources: Mapping[K, R] | None = None) -> None:
         """Initialize."""
@@ -257,6 +255,17 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
         if not all(self.values()):
             raise ValueError("A resource is empty.")
 
+    @classmethod
+    def _unchecked(cls: type[G], resources: Mapping[K, R]) -> G:
+        """Create a resource group without checking for empty resources.
+
+        Only for resource groups created from valid ones, where no resource
+        can be empty.
+        """
+        group = cls.__new__(cls)
+        object.__setattr__(group, "resources", resources)
+        return group
+
     def is_subset(self, other: G) -> bool:
         """Return true if the given resource is a subset of this group."""
         return self <= other
@@ -266,18 +275,27 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
         if not isinstance(other, self.__class__):
             return NotImplemented
 
-        new_resources: DefaultDict[K, list[R]] = defaultdict(list)
-        for index, resource in chain(self.items(), other.items()):
-            new_resources[index].append(resource)
+        if not other.resources:
+            return self
+
+        if not self.resources:
+            return other
+
+        new_resources: dict[K, R] = dict(self.resources)
+        for index, resource in other.items():
+            existing = new_resources.get(index)
+            new_resources[index] = resource if existing is None else existing + resource
 
-        new_resource = value_map(new_resources, lambda r: r[0].__class__.sum(*r))
-        return self.__class__(new_resource)
+        return self._unchecked(new_resources)
 
     def __sub__(self: G, other: G) -> G:
         """Subtract two resource groups."""
         if not isinstance(other, self.__class__):
             return NotImplemented
 
+        if not other.resources:
+            return self
+
         if not self.keys() >= other.keys():
             raise ValueError("Resource cannot be subtracted")
 
@@ -289,42 +307,37 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
             if resource:
                 new_resources[index] = resource
 
-        return self.__class__(new_resources)
+        return self._unchecked(new_resources)
 
     def __lt__(self: G, other: object) -> bool:
         """Check if other contains self."""
         if not isinstance(other, (AbstractResourceGroup, self.__class__)):
             return NotImplemented
 
-        for index, resource in self.items():
-            if index not in other or not resource <= other[index]:
-                return False
-
-        if self == other:
+        if self is other:
             return False
 
-        return True
+        return _is_proper_subset(self.resources, other.resources)
 
     def __gt__(self: G, other: object) -> bool:
         """Check if self contains other."""
         if not isinstance(other, (AbstractResourceGroup, self.__class__)):
             return NotImplemented
 
-        for index, resource in other.items():
-            if index not in self or not resource <= self[index]:
-                return False
-
-        if self == other:
+        if self is other:
             return False
 
-        return True
+        return _is_proper_subset(other.resources, self.resources)
 
     def __eq__(self: G, other: object) -> bool:
         """Check if self equals other."""
+        if self is other:
+            return True
+
         if not isinstance(other, (AbstractResourceGroup, self.__class__)):
             return NotImplemented
 
-        if self.keys() != other.keys():
+        if len(self) != len(other) or self.keys() != other.keys():
             return False
 
         for index in self:
@@ -333,6 +346,17 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
 
         return True
 
+    def __hash__(self) -> int:
+        """Hash of the resources, computed once as resource groups are immutable.
+
+        Mutable subclasses (allocation clusters) are not hashable.
+        """
+        hash_ = self.__dict__.get("_hash")
+        if hash_ is None:
+            hash_ = hash(frozenset(self.resources.items()))
+            object.__setattr__(self, "_hash", hash_)
+        return hash_
+
     def __getitem__(self, key: K) -> R:
         """Get element resource by key."""
         return self.resources.__getitem__(key)
@@ -350,6 +374,23 @@ class AbstractResourceGroup(Mapping[K, R], ResourceInterface, Generic[K, R]):
         return len(self.resources)
 
 
+def _is_proper_subset(small: Mapping[K, R], large: Mapping[K, R]) -> bool:
+    """Check if large contains small and they are not equal, in a single pass."""
+    if len(small) > len(large):
+        return False
+
+    # large has more indices than small, if small is a subset
+    proper = len(small) < len(large)
+    for index, resource in small.items():
+        other = large.get(index)
+        if other is None or not resource <= other:
+            return False
+        if not proper and resource != other:
+            proper = True
+
+    return proper
+
+
 class LogicalInterface(ResourceInterface):
     """A logical resource abstraction."""
 
@@ -407,8 +448,8 @@ class AbstractPhysicalResourceGroup(
             LogicalCluster: A logical resource
 
         """
-        resources = value_map(self, lambda r: r.as_logical())
-        return self.matching_logical_cls(resources)
+        resources = {k: r.as_logical() for k, r in self.resources.items()}
+        return self.matching_logical_cls._unchecked(resources)
 
     # type error because mypy does not support generic typevars
     def __and__(self: PRG, other: PRG) -> PRG:  # type: ignore
@@ -430,7 +471,7 @@ class AbstractPhysicalResourceGroup(
             if common:
                 resource_dict[index] = common
 
-        return self.__class__(resources=resource_dict)
+        return self._unchecked(resource_dict)
 
 
 class AllocationGroup(
@@ -448,19 +489,20 @@ class AllocationGroup(
     @property
     def total(self) -> G:
         """Return total resource group."""
-        return self.group_cls(value_map(self, lambda a: a.total))
+        total = {k: a.total for k, a in self.resources.items()}
+        return self.group_cls._unchecked(total)
 
     @property
     def acquired(self) -> G:
         """Return acquired resource group."""
-        acquired = value_map(self, lambda a: a.acquired)
-        return self.group_cls({k: v for k, v in acquired.items() if v})
+        acquired = ((k, a.acquired) for k, a in self.resources.items())
+        return self.group_cls._unchecked({k: v for k, v in acquired if v})
 
     @property
     def released(self) -> G:
         """Return released resource group."""
-        acquired = value_map(self, lambda a: a.released)
-        return self.group_cls({k: v for k, v in acquired.items() if v})
+        released = ((k, a.released) for k, a in self.resources.items())
+        return self.group_cls._unchecked({k: v for k, v in released if v})
 
     def acquire(self, group: G) -> AllocationGroup[K, A, G]:
         """Acquire a resource group.
@@ -472,10 +514,9 @@ class AllocationGroup(
         if not self.keys() >= group.keys():  # pylint: disable=no-member
             raise ValueError("Given group cannot be acquired")
 
-        new_resources = dict(self)
-        for idx, block in group.items():
-            new_resources[idx] = new_resources[idx].acquire(block)
-        return self.__class__(new_resources)
+        resources = self.resources
+        updates = {idx: resources[idx].acquire(block) for idx, block in group.items()}
+        return self._unchecked({**resources, **updates})
 
     def release(self, group: G) -> AllocationGroup[K, A, G]:
         """Release a resource group.
@@ -487,7 +528,6 @@ class AllocationGroup(
         if not self.keys() >= group.keys():  # pylint: disable=no-member
             raise ValueError("Given group cannot be released")
 
-        new_resources = dict(self)
-        for idx, block in group.items():
-            new_resources[idx] = new_resources[idx].release(block)
-        return self.__class__(new_resources)
+        resources = self.resources
+        updates = {idx: resources[idx].release(block) for idx, block in group.items()}
+        return self._unchecked({**resources, **updates})
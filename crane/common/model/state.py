@@ -17,13 +17,17 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+import threading
+import time
 from enum import Flag, auto
+from itertools import islice
 from typing import (
     TYPE_CHECKING,
+    Any,
     ClassVar,
     Generic,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Sequence,
@@ -33,13 +37,15 @@ from typing import (
     overload,
 )
 
+from pydantic import validator
+
 from crane.common.model import dataclass
-from crane.common.util.descriptor import cached_property
 from crane.common.util.generic import GenericArgsHookMixin
 from crane.common.util.serialization import CustomSerializeMixin, JsonValue
 
 S = TypeVar("S", bound="State")
 SH = TypeVar("SH", bound="State")
+T = TypeVar("T")
 
 
 class State(Flag):
@@ -65,12 +71,23 @@ class State(Flag):
             StateTransitionError: if next state is invalid
 
         """
-        if (self not in self._t_matrix) or (not next_ & self._t_matrix[self]):
+        allowed = self._t_matrix().get(self.value)
+        if allowed is None or not next_.value & allowed:
             raise StateTransitionError(self, next_)
 
-    @cached_property
-    def _t_matrix(self) -> Mapping[State, State]:
-        return dict(self.__transitions__())
+    @classmethod
+    def _t_matrix(cls) -> Mapping[int, int]:
+        """Return valid transitions of the state class, as a map of flag values."""
+        matrix = _T_MATRIX_CACHE.get(cls)
+        if matrix is None:
+            matrix = _T_MATRIX_CACHE[cls] = {
+                curr.value: next_.value for curr, next_ in cls.__transitions__()
+            }
+        return matrix
+
+
+# transition matrices are shared between members of each state class
+_T_MATRIX_CACHE: dict[type[State], dict[int, int]] = {}
 
 
 class StateTransitionError(Exception):
@@ -81,6 +98,74 @@ class StateTransitionError(Exception):
         super().__init__(f"Invalid state transition from {curr} to {next_}")
 
 
+# guards in-place appends to lists shared by _AppendLog
+_APPEND_LOCK = threading.Lock()
+
+
+class _AppendLog(Sequence[T]):
+    """A read-only prefix of a list that may be shared with longer logs.
+
+    Appending to the log with the whole list appends to the list in place,
+    so that each history does not copy all of its previous transitions.
+    """
+
+    __slots__ = ("_log", "_len")
+
+    def __init__(self, log: list[T]) -> None:
+        """Initialize."""
+        self._log = log
+        self._len = len(log)
+
+    def append(self, item: T) -> _AppendLog[T]:
+        """Return a new log with the item appended."""
+        # the list may be shared between threads, so check and append atomically
+        with _APPEND_LOCK:
+            if self._len == len(self._log):
+                self._log.append(item)
+                return _AppendLog(self._log)
+        # the list is already extended by another log, so copy the prefix
+        return _AppendLog([*self, item])
+
+    @overload
+    def __getitem__(self, idx: int) -> T:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> Sequence[T]:
+        ...
+
+    def __getitem__(self, idx: int | slice) -> T | Sequence[T]:
+        """Get the idx'th item."""
+        if isinstance(idx, slice):
+            return self._log[: self._len][idx]
+        if not -self._len <= idx < self._len:
+            raise IndexError("log index out of range")
+        return self._log[idx % self._len]
+
+    def __iter__(self) -> Iterator[T]:
+        """Iterate over items."""
+        return islice(self._log, self._len)
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __eq__(self, other: object) -> bool:
+        """Check if items are equal."""
+        if not isinstance(other, Sequence):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+def _append(items: Sequence[T], item: T) -> _AppendLog[T]:
+    """Return a log of items with the item appended."""
+    if isinstance(items, _AppendLog):
+        return items.append(item)
+    return _AppendLog([*items, item])
+
+
 @dataclass(frozen=True)
 class StateHistory(
     GenericArgsHookMixin, Sequence[Tuple[S, float]], Generic[S], CustomSerializeMixin
@@ -103,6 +188,17 @@ class StateHistory(
     timestamps: Sequence[float]
     states: Sequence[S]
 
+    # pylint: disable=no-self-argument
+    @validator("timestamps", "states", pre=True, allow_reuse=True)
+    def _log_to_list(cls, value: Any) -> Any:
+        """Accept logs of another history, e.g. on `dataclasses.replace`.
+
+        pydantic validates only builtin sequences, so copy the log into a list.
+        """
+        if isinstance(value, _AppendLog):
+            return list(value)
+        return value
+
     @classmethod
     def _generic_args_hook(cls, args: tuple) -> None:
         """Initialize init_state."""
@@ -112,8 +208,23 @@ class StateHistory(
     @classmethod
     def from_init(cls: type[StateHistory[S]]) -> StateHistory[S]:
         """Define class with a initial state."""
-        history = cls([], [])
-        return history.transition(cls.init_state)
+        return cls(timestamps=[time.time()], states=[cls.init_state])
+
+    @classmethod
+    def _from_logs(
+        cls: type[StateHistory[S]], timestamps: _AppendLog[float], states: _AppendLog[S]
+    ) -> StateHistory[S]:
+        """Create a history from logs, skipping validation which copies the logs.
+
+        Only for transitions: the logs extend those of a validated history by a
+        `time.time()` timestamp and a state checked by `transition`. The class
+        defines no `__post_init__` of its own, so skipping it only skips the
+        validation.
+        """
+        history = cls.__new__(cls)
+        object.__setattr__(history, "timestamps", timestamps)
+        object.__setattr__(history, "states", states)
+        return history
 
     @property
     def curr(self) -> S:
@@ -134,20 +245,23 @@ class StateHistory(
         """Transition to next state.
 
         Raises:
+            TypeError: if next state is not of the state class of the history
             StateTransitionError: if next state is invalid
 
         Returns:
             StateHistory[S]: new history object
 
         """
+        # validated here, as the new history is created without validation
+        if not isinstance(next_, self.init_state.__class__):
+            raise TypeError(
+                f"Expected {self.init_state.__class__.__name__}, got {next_!r}"
+            )
         if self.states:
             self.curr.validate(next_)
 
-        now = datetime.utcnow()
-        timestamp = now.replace(tzinfo=timezone.utc).timestamp()
-
-        return self.__class__(
-            timestamps=[*self.timestamps, timestamp], states=[*self.states, next_]
+        return self._from_logs(
+            _append(self.timestamps, time.time()), _append(self.states, next_)
         )
 
     def reset(self) -> StateHistory[S]:
@@ -176,6 +290,14 @@ class StateHistory(
     def __len__(self) -> int:
         return len(self.states)
 
+    def __hash__(self) -> int:
+        """Hash of the transitions, computed once as histories are immutable."""
+        hash_ = self.__dict__.get("_hash")
+        if hash_ is None:
+            hash_ = hash((tuple(self.timestamps), tuple(self.states)))
+            object.__setattr__(self, "_hash", hash_)
+        return hash_
+
     def _serialize(self) -> dict[str, JsonValue]:
         """Serialize into a dict."""
         return {
@@ -189,10 +311,7 @@ class StateHistory(
         timestamps = cast(List[float], value["timestamps"])
         states = cast(List[int], value["states"])
         state_cls = cls.init_state.__class__
-        return cls(
-            timestamps=timestamps,
-            states=[state_cls(s) for s in states],
-        )
+        return cls(timestamps=timestamps, states=list(map(state_cls, states)))
 
 
 class StateEntityMixin(Generic[S]):
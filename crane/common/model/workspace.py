@@ -36,13 +36,24 @@ class BaseWorkspace(DataClassJSONSerializeMixin):
     container_path: str
     tarball_path: str
 
+    # workspace ids are unique, thus compare and hash by id only
+    def __eq__(self, other: object) -> bool:
+        """Check if two workspaces have the same id."""
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.id == other.id  # type: ignore
 
-@dataclass(frozen=True)
+    def __hash__(self) -> int:
+        """Hash of the workspace id."""
+        return hash(self.id)
+
+
+@dataclass(frozen=True, eq=False)
 class LocalWorkspace(BaseWorkspace):
     """Workspace that has local tarball path."""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class RemoteWorkspace(BaseWorkspace):
     """Workspace that has remote tarball path."""
 
@@ -14,25 +14,119 @@
 # ==============================================================================
 
 
-"""Handling sync function asynchronously."""
+"""Compressing and extracting tarballs asynchronously."""
 
 from __future__ import annotations
 
+import asyncio
 import os
+import shutil
 import tarfile
+from functools import lru_cache
 
 from crane.common.util.asynclib import sync_to_async
+from crane.common.util.process import ProcessException
+
+
+# copy buffer of tarfile, which defaults to 16KiB. takes effect on python 3.8+
+_COPY_BUFSIZE = 2 * 1024 * 1024
+
+
+@lru_cache(maxsize=None)
+def _which(cmd: str) -> str | None:
+    """Return path of the executable, or None if it is not installed."""
+    return shutil.which(cmd)
+
+
+async def _wait(*procs: asyncio.subprocess.Process) -> None:
+    """Wait for processes to exit.
+
+    Raises:
+        ProcessException: If a process exit with non-zero status
+
+    """
+    returncodes = await asyncio.gather(*(proc.wait() for proc in procs))
+    for returncode in returncodes:
+        if returncode != 0:
+            raise ProcessException(returncode)
+
+
+async def compress(dst_file: str, src_dir: str, *, level: int = 1) -> None:
+    """Asynchronously compress tarball.
+
+    If tar and pigz are installed, the tarball is streamed from tar to pigz
+    through a pipe, so that compression runs in parallel outside of python.
+    Otherwise, falls back to tarfile.
+
+    Args:
+        dst_file (str): path of the tarball
+        src_dir (str): directory to compress
+        level (int): gzip compression level from 1 (fastest) to 9 (smallest).
+            Defaults to 1.
+
+    Raises:
+        ProcessException: If tar or pigz exit with non-zero status
+
+    """
+    tar_bin, pigz_bin = _which("tar"), _which("pigz")
+    if tar_bin is None or pigz_bin is None:
+        await _compress_tarfile(dst_file, src_dir, level)
+        return
+
+    parent, name = os.path.split(os.path.abspath(src_dir))
+    read_fd, write_fd = os.pipe()
+    with open(dst_file, "wb") as dst:
+        try:
+            tar = await asyncio.create_subprocess_exec(
+                tar_bin, "-C", parent, "-cf", "-", name, stdout=write_fd
+            )
+            try:
+                pigz = await asyncio.create_subprocess_exec(
+                    pigz_bin, "-c", f"-{level}", stdin=read_fd, stdout=dst
+                )
+            except BaseException:
+                # do not leave tar orphaned, blocked on the pipe without reader
+                if tar.returncode is None:
+                    tar.kill()
+                await tar.wait()
+                raise
+        finally:
+            # the pipe is owned by the child processes
+            os.close(read_fd)
+            os.close(write_fd)
+        await _wait(tar, pigz)
+
+
+async def extract(dst_dir: str, src_file: str) -> None:
+    """Asynchronously extract tarball.
+
+    If tar is installed, the tarball is extracted by tar. Otherwise, falls back
+    to tarfile.
+
+    Raises:
+        ProcessException: If tar exit with non-zero status
+
+    """
+    tar_bin = _which("tar")
+    if tar_bin is None:
+        await _extract_tarfile(dst_dir, src_file)
+        return
+
+    os.makedirs(dst_dir, exist_ok=True)
+    # tar detects the compression of the tarball
+    tar = await asyncio.create_subprocess_exec(tar_bin, "-xf", src_file, "-C", dst_dir)
+    await _wait(tar)
 
 
 @sync_to_async
-def compress(dst_file: str, src_dir: str) -> None:
-    """Asynchronously compress tarball."""
-    with tarfile.open(dst_file, "w:gz") as tar:
+def _compress_tarfile(dst_file: str, src_dir: str, level: int) -> None:
+    with tarfile.open(dst_file, "w:gz", compresslevel=level) as tar:
+        tar.copybufsize = _COPY_BUFSIZE
         tar.add(src_dir, arcname=os.path.basename(src_dir))
 
 
 @sync_to_async
-def extract(dst_dir: str, src_file: str) -> None:
-    """Asynchronously extract tarball."""
+def _extract_tarfile(dst_dir: str, src_file: str) -> None:
     with tarfile.open(src_file) as tar:
+        tar.copybufsize = _COPY_BUFSIZE
         tar.extractall(path=dst_dir)
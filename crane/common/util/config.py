@@ -18,6 +18,8 @@
 from __future__ import annotations
 
 from copy import deepcopy
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Any, Dict, List, Tuple, TypeVar, Union
 
 from google.protobuf.struct_pb2 import ListValue, Struct
@@ -25,27 +27,42 @@ from google.protobuf.struct_pb2 import ListValue, Struct
 JSONType = Union[str, int, float, bool, None, Dict[str, Any], List[Any]]
 
 
-def _parse_key_string(key: str) -> list[str]:
+@lru_cache(maxsize=1024)
+def _parse_key_string(key: str) -> tuple[str, ...]:
+    # configs are queried with a few distinct keys, thus cache the split keys
     if not key:
         raise KeyError(key)
-    key_list = key.split(".")
-    return list(key_list)
+    return tuple(key.split("."))
 
 
 def _is_subset(sub_dict: dict, super_dict: dict) -> bool:
-    for k, v in sub_dict.items():
-        if k not in super_dict:
-            return False
-        o_v = super_dict[k]
-        if isinstance(v, dict):
-            if not _is_subset(v, o_v):
+    stack = [(sub_dict, super_dict)]
+    while stack:
+        sub, sup = stack.pop()
+        for k, v in sub.items():
+            if k not in sup:
                 return False
-        else:
-            if v != o_v:
+            o_v = sup[k]
+            if isinstance(v, dict):
+                if not isinstance(o_v, dict):
+                    return False
+                stack.append((v, o_v))
+            elif v != o_v:
                 return False
     return True
 
 
+def _json_clone(o: Any) -> Any:
+    """Deep copy a json-like value, falling back to deepcopy for other values."""
+    if type(o) is dict:  # pylint: disable=unidiomatic-typecheck
+        return {k: _json_clone(v) for k, v in o.items()}
+    if type(o) is list:  # pylint: disable=unidiomatic-typecheck
+        return [_json_clone(v) for v in o]
+    if o is None or isinstance(o, (str, int, float)):
+        return o
+    return deepcopy(o)
+
+
 def struct_to_dict(s: Struct) -> dict:
     """Transform protobuf struct to python dict (nested).
 
@@ -56,16 +73,16 @@ def struct_to_dict(s: Struct) -> dict:
         dict : transformed dict
 
     """
-    # todo: comment due to disagreement in black and pydocstyle
+    return {k: _parse_struct_value(v) for k, v in s.items()}
 
-    def _parse(o):
-        if isinstance(o, Struct):
-            return struct_to_dict(o)
-        if isinstance(o, ListValue):
-            return [_parse(i) for i in o]  # type: ignore
-        return o
 
-    return {k: _parse(v) for k, v in s.items()}
+def _parse_struct_value(o: Any) -> Any:
+    # scalars are the most common values
+    if not isinstance(o, (Struct, ListValue)):
+        return o
+    if isinstance(o, Struct):
+        return struct_to_dict(o)
+    return [_parse_struct_value(i) for i in o]  # type: ignore
 
 
 class ConfigInvalidException(Exception):
@@ -84,13 +101,9 @@ class ConfigInvalidException(Exception):
         super().__init__(err_str)
 
 
-class _Namespace:
+class _Namespace(SimpleNamespace):
     """Simple object for storing attributes."""
 
-    def __init__(self, **kwargs):
-        for name, val in kwargs.items():
-            setattr(self, name, val)
-
     def __eq__(self, other):
         if not isinstance(other, _Namespace):
             raise TypeError
@@ -198,7 +211,7 @@ class Config(dict):
 
     def copy(self: T) -> T:
         """Create a deepcopy."""
-        return deepcopy(self)
+        return self.__class__({k: _json_clone(v) for k, v in self.items()})
 
     def build(self) -> _Namespace:
         """Build dictionary into namespace.
@@ -24,15 +24,16 @@ Issues:
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from typing_extensions import Protocol
 
 # cached_property supported natively since python 3.8
-try:
+if sys.version_info >= (3, 8):
     # pylint: disable=unused-import
     from functools import cached_property  # type: ignore
-except ImportError:
+else:
 
     # mypy does not support decorated properties.
     if TYPE_CHECKING:
@@ -15,10 +15,14 @@
 
 """Utilities for gpu."""
 
-import pathlib
-import re
+import os
+from functools import lru_cache
 from typing import AbstractSet
 
+# containers are given two verbs devices, uverbs0 and uverbs1 (see common.docker)
+_INFINIBAND_DIR = "/dev/infiniband"
+_RDMA_VERBS = ("uverbs0", "uverbs1")
+
 
 def parse_gpu_indices(gpus: str) -> AbstractSet[int]:
     """Parse a CUDA_VISIBLE_DEVICE-like gpu string."""
@@ -27,22 +31,31 @@ def parse_gpu_indices(gpus: str) -> AbstractSet[int]:
     if not gpus:
         return frozenset()
 
-    if re.fullmatch(r"\d+(,\d+)*", gpus) is None:
+    # comma separated digits, e.g. "0,1,3"
+    digits = gpus.replace(",", "")
+    if (
+        not (digits.isascii() and digits.isdigit())
+        or ",," in gpus
+        or gpus[0] == ","
+        or gpus[-1] == ","
+    ):
         raise TypeError(gpus)
 
     return frozenset(map(int, gpus.split(",")))
 
 
+@lru_cache(maxsize=1)
 def get_available_gpus() -> AbstractSet[int]:
     """Return available gpu index numbers.
 
+    GPUs do not change while running, thus cached. Use `cache_clear` to probe again.
+
     Returns:
         AbstractSet[int]: index numbers of available GPUs
 
     """
     try:
-        p = pathlib.Path("/proc/driver/nvidia/gpus")
-        gpu_count = len(list(p.iterdir()))
+        gpu_count = len(os.listdir("/proc/driver/nvidia/gpus"))
     except FileNotFoundError:
         return frozenset()
 
@@ -53,14 +66,9 @@ def check_rdma() -> bool:
     """Check if rdma is possible in this node.
 
     Returns:
-        bool: true if rdma possible
+        bool: true if the verbs devices given to containers exist
 
     """
-    try:
-        p = pathlib.Path("/dev/infiniband")
-        verb_file_list = [x for x in p.iterdir() if "uverb" in p.name]
-    except FileNotFoundError:
-        return False
-
-    use_rdma = len(verb_file_list) == 2
-    return use_rdma
+    return all(
+        os.path.exists(os.path.join(_INFINIBAND_DIR, name)) for name in _RDMA_VERBS
+    )
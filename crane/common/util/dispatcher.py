@@ -62,8 +62,7 @@ class Dispatcher(Generic[K, T]):
         """
         channel = self.channels.get(key)
         if channel is None:
-            channel = Channel()
-            self.channels[key] = channel
+            channel = self.channels[key] = Channel()
 
         return channel.subscribe()
 
@@ -98,11 +98,34 @@ def expand_arg_group(f: Callable) -> Callable:
 
     new_sig = Signature(parameters, return_annotation=org_sig.return_annotation)
 
-    def _group_arguments(*args, **kwargs) -> dict:
-        nonlocal new_sig
+    # Precompute binding of arguments, as Signature.bind is slow
+    positional_names = [
+        p.name for p in parameters if p.kind is Parameter.POSITIONAL_OR_KEYWORD
+    ]
+    param_names = {p.name for p in parameters}
+    defaults = {p.name: p.default for p in parameters if p.default is not p.empty}
+    fast_bind = all(
+        p.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        for p in parameters
+    )
+
+    def _bind(args: tuple, kwargs: dict) -> dict:
+        if fast_bind and len(args) <= len(positional_names):
+            arguments = dict(zip(positional_names, args))
+            if arguments.keys().isdisjoint(kwargs):
+                arguments.update(kwargs)
+                for name, default in defaults.items():
+                    arguments.setdefault(name, default)
+                if arguments.keys() == param_names:
+                    return arguments
+
+        # invalid arguments or signature with variadic arguments
         bound_args = new_sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
-        arguments = bound_args.arguments
+        return bound_args.arguments
+
+    def _group_arguments(*args, **kwargs) -> dict:
+        arguments = _bind(args, kwargs)
 
         for group_name, fields in group_field_mapping.items():
             group_cls = arg_groups[group_name]
@@ -32,6 +32,9 @@ from crane.common.util.store import DoesNotExistError
 
 logger = logging.getLogger(__name__)
 
+# interfaces that are not reachable from other nodes
+_SKIP_INTERFACES = frozenset({"docker0", "docker_gwbridge", "lo"})
+
 
 @dataclass
 class EndPoint(DataClassJSONSerializeMixin):
@@ -84,7 +87,7 @@ def get_available_ip_address() -> list[str]:
     """
     interfaces = []
     for name in netifaces.interfaces():
-        if name in ("docker0", "docker_gwbridge", "lo"):
+        if name in _SKIP_INTERFACES:
             continue
         interface = netifaces.ifaddresses(name)
         inet_interfaces = interface.get(netifaces.AF_INET, [])
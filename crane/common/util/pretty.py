@@ -17,8 +17,9 @@
 
 from __future__ import annotations
 
-from dataclasses import astuple, is_dataclass
+from dataclasses import is_dataclass
 from enum import Enum
+from functools import lru_cache
 from typing import _GenericAlias  # type: ignore
 from typing import Any, Callable, Sequence, TypeVar
 
@@ -36,8 +37,10 @@ def tabulate_dataclass(dataclass_list: list[Any]) -> str:
     if len(classes) > 1:
         raise ValueError("Different dataclasses detected")
 
-    rows = [astuple(obj) for obj in dataclass_list]
-    columns = [(name, f.type) for name, f in classes[0].__dataclass_fields__.items()]
+    # read fields directly, since astuple deep copies nested values
+    fields = classes[0].__dataclass_fields__
+    rows = [tuple(getattr(obj, name) for name in fields) for obj in dataclass_list]
+    columns = [(name, f.type) for name, f in fields.items()]
 
     return tabulate_rows(rows, columns)
 
@@ -46,14 +49,22 @@ T = TypeVar("T", bound=Sequence[Any])
 
 
 def tabulate_rows(rows: list[T], columns: list[tuple[str, type]]) -> str:
-    """Format a list of rows into a table."""
+    """Format a list of rows into a table.
+
+    Args:
+        rows (list[T]): rows of the table
+        columns (list[tuple[str, type]]): name and type of each column
+
+    Returns:
+        str: the table
+
+    """
     col_names, col_types = list(zip(*columns))
 
     formatters = [_format_factory(t) for t in col_types]
 
     data = [_format_row(row, formatters) for row in rows]
-    table = tabulate(data, headers=col_names)
-    return table
+    return tabulate(data, headers=col_names)
 
 
 def _format_row(row: T, formatters: list[Callable[[Any], str]]) -> list[str]:
@@ -68,10 +79,15 @@ def _format_row(row: T, formatters: list[Callable[[Any], str]]) -> list[str]:
     return formatted_row
 
 
+@lru_cache(maxsize=128)
 def _format_factory(type_: type | _GenericAlias) -> Callable[[Any], str]:
     if isinstance(type_, _GenericAlias):
         type_ = type_.__origin__
 
+    formatter = _FORMATTERS.get(type_)
+    if formatter is not None:
+        return formatter
+
     if issubclass(type_, (list, tuple)):
         return _format_sequence
     if issubclass(type_, Enum):
@@ -104,3 +120,11 @@ def _format_enum(o: Enum) -> str:
 
 def _format_bytes(o: bytes) -> str:
     return repr(o)
+
+
+_FORMATTERS: dict[type, Callable[[Any], str]] = {
+    str: _format_identity,
+    list: _format_sequence,
+    tuple: _format_sequence,
+    bytes: _format_bytes,
+}
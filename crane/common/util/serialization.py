@@ -20,7 +20,7 @@ from __future__ import annotations
 import abc
 import json
 import pickle
-from typing import Dict, List, TypeVar, Union, cast
+from typing import Any, Callable, Dict, List, TypeVar, Union, cast
 
 from google.protobuf.struct_pb2 import Struct
 from mashumaro import DataClassJSONMixin, DataClassMessagePackMixin, DataClassYAMLMixin
@@ -133,6 +133,37 @@ class DataClassMsgpackSerializeMixin(DataClassMessagePackMixin):
         return cls.from_msgpack(data)
 
 
+class CachedSerializeMixin:
+    """A mixin that caches json/yaml serialization on the instance.
+
+    Only for frozen dataclasses whose fields are never modified in place.
+    Place it before the mashumaro mixins. Calls with custom encoder arguments
+    are not cached.
+    """
+
+    def _cached(self, key: str, serialize: Callable[[], str]) -> str:
+        cache = self.__dict__.get("_serialized")
+        if cache is None:
+            cache = {}
+            # bypass frozen dataclass __setattr__
+            object.__setattr__(self, "_serialized", cache)
+        if key not in cache:
+            cache[key] = serialize()
+        return cache[key]
+
+    def to_json(self, *args: Any, **kwargs: Any) -> str:
+        """Serialize into json."""
+        if args or kwargs:
+            return super().to_json(*args, **kwargs)  # type: ignore
+        return self._cached("json", super().to_json)  # type: ignore
+
+    def to_yaml(self, *args: Any, **kwargs: Any) -> str:
+        """Serialize into yaml."""
+        if args or kwargs:
+            return super().to_yaml(*args, **kwargs)  # type: ignore
+        return self._cached("yaml", super().to_yaml)  # type: ignore
+
+
 class CustomSerializeMixin(abc.ABC, SerializableType, _DictToByteSerializationMixin):
     """Custom serialization mixin that works both for erm and mashumaro."""
 
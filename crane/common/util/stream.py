@@ -31,26 +31,64 @@ def anext_task(stream: AsyncIterator[T]) -> asyncio.Task[T]:
     return asyncio.create_task(stream.__anext__())
 
 
+async def _pump(
+    stream: AsyncIterator[T], queue: asyncio.Queue, slots: asyncio.Semaphore
+) -> None:
+    """Forward every element of stream to queue, followed by an end marker.
+
+    The end marker carries the exception that stopped the stream, if any. It is
+    enqueued even when the stream or the pump itself is cancelled, so that the
+    consumer never waits for a pump that is gone.
+    """
+    error: BaseException | None = None
+    try:
+        async for item in stream:
+            await slots.acquire()
+            queue.put_nowait((True, item))
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        # the queue is unbounded, so this never blocks nor fails
+        queue.put_nowait((False, error))
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    """Mark the exception of a finished pump as retrieved.
+
+    merge() re-raises it from the end marker, so asyncio need not report it.
+    """
+    if not task.cancelled():
+        task.exception()
+
+
 async def merge(*streams: AsyncIterator[T]) -> AsyncIterator[T]:
     """Merge multiple streams into one stream(iterator)."""
-    stream_list = list(streams)
-    tasks: "list[asyncio.Future[T]]" = [anext_task(s) for s in stream_list]
-
-    while tasks:
-        assert len(tasks) == len(stream_list)
-        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-
-        # read from done
-        for task in done:
-            try:
-                yield await task
-            except StopAsyncIteration:
-                idx = tasks.index(task)
-                del tasks[idx]
-                del stream_list[idx]
-
-        # re-read stream
-        # use range(len) instead of enumerate to avoid copying
-        for idx in range(len(tasks)):  # pylint: disable=consider-using-enumerate
-            if tasks[idx] in done:
-                tasks[idx] = anext_task(stream_list[idx])
+    # no task bookkeeping needed for a single stream
+    if len(streams) == 1:
+        async for item in streams[0]:
+            yield item
+        return
+
+    # one long-lived reader per stream instead of one task per element.
+    # the semaphore bounds buffered elements to the number of streams
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(len(streams))
+    pumps = [asyncio.create_task(_pump(s, queue, slots)) for s in streams]
+    for pump in pumps:
+        pump.add_done_callback(_retrieve_exception)
+
+    alive = len(pumps)
+    try:
+        while alive:
+            ok, payload = await queue.get()
+            if ok:
+                slots.release()
+                yield payload
+            elif payload is None:
+                alive -= 1
+            else:
+                raise payload
+    finally:
+        for pump in pumps:
+            pump.cancel()
@@ -20,24 +20,39 @@ from __future__ import annotations
 import asyncio
 import sys
 from dataclasses import dataclass
+from inspect import Parameter, Signature
+from typing import Any, Callable
 
-SYNC_FUNC_TEMPLATE = """\
-@pytest.fixture
-def {fixture_name}({args}):
-    fixture_obj = {datacls}({args})
-    if hasattr(fixture_obj, "__fixture__"):
-        fixture_obj.__fixture__()
-    return fixture_obj
-"""
-
-ASYNC_FUNC_TEMPLATE = """\
-@pytest.fixture
-async def {fixture_name}({args}):
-    fixture_obj = {datacls}({args})
-    if hasattr(fixture_obj, "__fixture__"):
-        await fixture_obj.__fixture__()
-    return fixture_obj
-"""
+
+def _fixture_function(datacls: type, is_async: bool) -> Callable[..., Any]:
+    """Build a fixture function that instantiates datacls from its fields."""
+    if is_async:
+
+        async def fixture(**kwargs):
+            fixture_obj = datacls(**kwargs)
+            await fixture_obj.__fixture__()
+            return fixture_obj
+
+    else:
+
+        def fixture(**kwargs):  # type: ignore
+            fixture_obj = datacls(**kwargs)
+            if hasattr(fixture_obj, "__fixture__"):
+                fixture_obj.__fixture__()
+            return fixture_obj
+
+    # pytest resolves fixture arguments from the signature
+    setattr(
+        fixture,
+        "__signature__",
+        Signature(
+            [
+                Parameter(name, Parameter.POSITIONAL_OR_KEYWORD)
+                for name in getattr(datacls, "__dataclass_fields__")
+            ]
+        ),
+    )
+    return fixture
 
 
 def make_fixture_group(fixture_name: str):
@@ -49,18 +64,18 @@ def make_fixture_group(fixture_name: str):
     """
 
     def _wrapper(cls):
-        datacls = dataclass(cls)
-        args = ", ".join(getattr(datacls, "__dataclass_fields__"))
-
-        template = SYNC_FUNC_TEMPLATE
-        if hasattr(cls, "__fixture__") and asyncio.iscoroutinefunction(cls.__fixture__):
-            template = ASYNC_FUNC_TEMPLATE
+        import pytest  # pylint: disable=import-outside-toplevel
 
-        func_code = template.format(
-            fixture_name=fixture_name, datacls=datacls.__name__, args=args
+        datacls = dataclass(cls)
+        is_async = hasattr(cls, "__fixture__") and asyncio.iscoroutinefunction(
+            cls.__fixture__
         )
+
+        fixture = _fixture_function(datacls, is_async)
+        fixture.__name__ = fixture.__qualname__ = fixture_name
+        fixture.__module__ = cls.__module__
         global_ns = sys.modules[cls.__module__].__dict__
-        exec(func_code, global_ns)  # pylint: disable=exec-used
+        global_ns[fixture_name] = pytest.fixture(fixture)
 
         return cls
 
@@ -139,6 +139,7 @@ COMMON_DEPS = [
     "typer[all]==0.3.2",
     "rich==10.9.0",
     "python-dateutil==2.8.2",
+    "importlib_metadata; python_version < '3.8'",
 ]
 
 
@@ -171,7 +172,7 @@ setup(
     },
     entry_points={
         "console_scripts": [
-            "crane = crane.cli.user:app",
+            "crane = crane.cli.user:main",
         ]
     },
     include_package_data=True,
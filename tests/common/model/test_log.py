@@ -0,0 +1,62 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for log models."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+
+from crane.common.model import log
+
+
+@pytest.fixture
+def fresh_clock(monkeypatch):
+    """Reset the cached clock read, as if no log was created yet."""
+    monkeypatch.setattr(log, "_last_read", (float("-inf"), datetime.min))
+
+
+def test_coarse_utcnow_first_call(fresh_clock):  # pylint: disable=unused-argument
+    before = datetime.utcnow()
+    now = log._coarse_utcnow()  # pylint: disable=protected-access
+    assert before <= now <= datetime.utcnow()
+
+
+def test_coarse_utcnow_first_call_concurrent(
+    fresh_clock,
+):  # pylint: disable=unused-argument
+    results: list[datetime] = []
+    barrier = threading.Barrier(8)
+
+    def _read():
+        barrier.wait()
+        results.append(log._coarse_utcnow())  # pylint: disable=protected-access
+
+    threads = [threading.Thread(target=_read) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == 8
+    assert all(abs(datetime.utcnow() - now) < timedelta(seconds=5) for now in results)
+
+
+def test_log_default_timestamp(fresh_clock):  # pylint: disable=unused-argument
+    log_ = log.Log(container_id="c", source=log.LogSource.STDOUT, log="hello")
+    assert log_.timestamp.year == datetime.utcnow().year
@@ -0,0 +1,139 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for basic resource constructs."""
+
+from __future__ import annotations
+
+import pytest
+
+from crane.common.model.resource import Logical, Physical
+
+
+def test_gpu_indices():
+    assert Physical([0, 2, 5]).gpu_indices == frozenset({0, 2, 5})
+    assert Physical(iter([3, 3])).gpu_indices == frozenset({3})
+    assert Physical([]).gpu_indices == frozenset()
+
+
+@pytest.mark.parametrize("index", [-1, 1.0, "0", None, True])
+def test_invalid_index(index):
+    with pytest.raises(ValueError, match="Invalid GPU index"):
+        Physical([0, index])
+
+
+def test_lazy_gpu_indices():
+    resource = Physical([0, 1]) + Physical([4])
+    assert resource.gpu_indices == frozenset({0, 1, 4})
+    assert (Physical([0, 1, 4]) - Physical([1])).gpu_indices == frozenset({0, 4})
+    assert Physical.empty().gpu_indices == frozenset()
+
+
+def test_empty():
+    assert Physical.empty() is Physical.empty()
+    assert Physical.empty() == Physical([])
+    assert not Physical.empty()
+    assert Physical([0])
+
+
+def test_add():
+    assert Physical([0, 1]) + Physical([2]) == Physical([0, 1, 2])
+    assert Physical([0]) + Physical.empty() == Physical([0])
+
+    with pytest.raises(ValueError):
+        Physical([0, 1]) + Physical([1, 2])
+
+
+def test_sub():
+    assert Physical([0, 1, 2]) - Physical([1]) == Physical([0, 2])
+    assert Physical([0, 1]) - Physical([0, 1]) == Physical.empty()
+
+    with pytest.raises(ValueError):
+        Physical([0, 1]) - Physical([1, 2])
+
+
+def test_and():
+    assert Physical([0, 1, 2]) & Physical([1, 2, 3]) == Physical([1, 2])
+    assert Physical([0]) & Physical([1]) == Physical.empty()
+
+
+def test_sum():
+    resources = [Physical([0]), Physical([1, 2]), Physical([7])]
+    assert Physical.sum(*resources) == Physical([0, 1, 2, 7])
+    assert Physical.sum() == Physical.empty()
+
+    with pytest.raises(ValueError):
+        Physical.sum(Physical([0]), Physical([1]), Physical([0, 3]))
+
+
+def test_subset():
+    small, large = Physical([1]), Physical([0, 1, 2])
+    assert small < large
+    assert large > small
+    assert small <= large
+    assert small.is_subset(large)
+    assert large.is_subset(large)
+    assert not large.is_subset(small)
+
+    assert not large < large
+    assert not large > large
+
+    disjoint = Physical([3])
+    assert not small < disjoint
+    assert not small > disjoint
+    assert not small.is_subset(disjoint)
+
+
+def test_eq_and_hash():
+    assert Physical([2, 0]) == Physical([0, 2])
+    assert Physical([0]) != Physical([1])
+    assert hash(Physical([2, 0])) == hash(Physical([0]) + Physical([2]))
+    assert len({Physical([0, 1]), Physical([1, 0]), Physical([1])}) == 2
+
+
+def test_other_types():
+    assert Physical([0]) != frozenset({0})
+    with pytest.raises(TypeError):
+        Physical([0]) + Logical(1)  # pylint: disable=expression-not-assigned
+    with pytest.raises(TypeError):
+        Physical([0]) & frozenset({0})  # pylint: disable=expression-not-assigned
+
+
+def test_as_logical():
+    assert Physical([0, 3, 9]).as_logical() == Logical(3)
+    assert Physical.empty().as_logical() == Logical(0)
+    assert Physical(range(100)).as_logical() == Logical(100)
+
+
+def test_logical_operators():
+    assert Logical(1) + Logical(2) == Logical(3)
+    assert Logical(3) - Logical(1) == Logical(2)
+    assert Logical(1) < Logical(2)
+    assert Logical(2) > Logical(1)
+    assert hash(Logical(4)) == hash(Logical(2) + Logical(2))
+
+    with pytest.raises(ValueError):
+        Logical(1) - Logical(2)
+
+
+def test_logical_other_types():
+    class _Fake:
+        num_gpu = 1
+
+    assert Logical(1) != _Fake()
+    with pytest.raises(TypeError):
+        Logical(1) + _Fake()  # pylint: disable=expression-not-assigned
+    with pytest.raises(TypeError):
+        Logical(1) < _Fake()  # pylint: disable=expression-not-assigned
@@ -0,0 +1,106 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for state histories."""
+
+from __future__ import annotations
+
+import dataclasses
+
+import pytest
+
+from crane.common.model.mini_cluster import State, StateHistory
+from crane.common.model.state import StateTransitionError
+
+
+def _running() -> StateHistory:
+    return StateHistory.from_init().transition(State.RUNNING)
+
+
+def test_from_init():
+    history = StateHistory.from_init()
+    assert list(history.states) == [State.QUEUED]
+    assert len(history.timestamps) == 1
+    assert history.curr is State.QUEUED
+    assert history.created == history.timestamp
+
+
+def test_transition():
+    init = StateHistory.from_init()
+    running = init.transition(State.RUNNING)
+    done = running.transition(State.DONE)
+
+    assert list(init.states) == [State.QUEUED]
+    assert list(running.states) == [State.QUEUED, State.RUNNING]
+    assert list(done.states) == [State.QUEUED, State.RUNNING, State.DONE]
+    assert len(done.timestamps) == 3
+    assert list(done.timestamps) == sorted(done.timestamps)
+    assert done.curr is State.DONE
+    assert done[1] == (State.RUNNING, done.timestamps[1])
+
+
+def test_invalid_transition():
+    with pytest.raises(StateTransitionError):
+        StateHistory.from_init().transition(State.DONE)
+
+    with pytest.raises(TypeError):
+        StateHistory.from_init().transition("RUNNING")  # type: ignore
+
+
+def test_branching_copies_on_write():
+    running = _running()
+    done = running.transition(State.DONE)
+    paused = running.transition(State.PAUSED)
+    resumed = paused.transition(State.RUNNING)
+
+    assert list(running.states) == [State.QUEUED, State.RUNNING]
+    assert list(done.states) == [State.QUEUED, State.RUNNING, State.DONE]
+    assert list(paused.states) == [State.QUEUED, State.RUNNING, State.PAUSED]
+    assert list(resumed.states) == [*paused.states, State.RUNNING]
+    assert len(done.timestamps) == len(paused.timestamps) == 3
+
+
+def test_equality_and_hash():
+    running = _running()
+    copied = StateHistory(
+        timestamps=list(running.timestamps), states=list(running.states)
+    )
+
+    assert copied == running
+    assert running == copied
+    assert hash(copied) == hash(running)
+    assert len({running, copied}) == 1
+
+    done = running.transition(State.DONE)
+    assert done != running
+    assert hash(done) == hash(done)
+
+
+def test_revalidation():
+    running = _running()
+
+    assert dataclasses.replace(running) == running
+    assert StateHistory(running.timestamps, running.states) == running
+
+
+def test_serialization():
+    history = _running().transition(State.DONE)
+
+    assert StateHistory.from_json(history.to_json()) == history
+    assert StateHistory.from_dict(history.to_dict()) == history
+    assert history.to_dict() == {
+        "timestamps": list(history.timestamps),
+        "states": [s.value for s in history.states],
+    }
@@ -0,0 +1,200 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for docker option utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from crane.common.docker import ContainerOption, network_attach_option
+from crane.common.model.container import MountMapping, PortMapping
+from crane.vendor import async_docker as ad
+
+_MOUNTS = (MountMapping("/data", "/workspace/data", "ro"), MountMapping("/a", "/b"))
+_PORTS = (
+    PortMapping(8080, 30000, "0.0.0.0"),
+    PortMapping(8080, 30001, "::"),
+    PortMapping(53, 30002, "0.0.0.0", "udp"),
+)
+_SETTINGS = dict(
+    image="ubuntu:20.04",
+    cmd="python -m http.server 'port 8080'",
+    user="crane",
+    init=True,
+    envs={"A": "1", "B": "2"},
+    mounts=_MOUNTS,
+    ports=_PORTS,
+    networks=network_attach_option({"crane": ["web", "web-0"]}),
+    hostname="web-0",
+    rdma=True,
+    shm_size=1 << 30,
+    pid_host=True,
+    health_cmd="curl -f localhost:8080",
+    log_url="localhost:24224",
+    auto_remove=True,
+    restart_policy="on-failure",
+    maximum_retry=3,
+)
+
+
+def _chained() -> ContainerOption:
+    """Apply the settings one setter at a time."""
+    s = _SETTINGS
+    return (
+        ContainerOption()
+        .set_image(s["image"])
+        .set_process(s["cmd"], s["user"], s["init"])
+        .set_envs(s["envs"])
+        .set_storage(*s["mounts"])
+        .set_ports(*s["ports"])
+        .set_network(s["networks"], s["hostname"], s["rdma"])
+        .set_host(s["shm_size"])
+        .set_runtime(s["pid_host"], s["health_cmd"], s["log_url"])
+        .set_exit(
+            auto_remove=s["auto_remove"],
+            restart_policy=s["restart_policy"],
+            maximum_retry=s["maximum_retry"],
+        )
+    )
+
+
+def _payload(option: ContainerOption) -> dict:
+    """Return the request body sent to the docker engine."""
+    return option.dict(by_alias=True, exclude_none=True)
+
+
+def _assert_valid(option: ContainerOption) -> None:
+    """Check that skipping validation creates what validation would create."""
+    validated = ContainerOption.parse_obj(_payload(option))
+    assert _payload(validated) == _payload(option)
+
+
+def test_configure():
+    option = ContainerOption().configure(**_SETTINGS)
+    _assert_valid(option)
+    assert _payload(option) == _payload(_chained())
+
+    assert option.image == "ubuntu:20.04"
+    assert option.cmd == ["python", "-m", "http.server", "port 8080"]
+    assert option.user == "crane"
+    assert option.env == ["A=1", "B=2"]
+    assert option.hostname == "web-0"
+    assert set(option.exposed_ports) == {"8080/tcp", "53/udp"}
+    assert option.healthcheck.test == ["curl", "-f", "localhost:8080"]
+
+    host = option.host_config
+    assert host.init is True
+    assert host.binds == ["/data:/workspace/data:ro", "/a:/b:rw"]
+    assert host.port_bindings["8080/tcp"] == [
+        {"HostPort": "30000", "HostIp": "0.0.0.0"},
+        {"HostPort": "30001", "HostIp": "::"},
+    ]
+    assert host.cap_add == ["IPC_LOCK", "SYS_NICE"]
+    assert [d.path_on_host for d in host.devices] == [
+        "/dev/infiniband/uverbs0",
+        "/dev/infiniband/uverbs1",
+    ]
+    assert host.shm_size == 1 << 30
+    assert host.pid_host == "host"
+    assert host.log_config.config["fluentd-address"] == "localhost:24224"
+    assert host.auto_remove is True
+    assert host.restart_policy.name == "on-failure"
+    assert host.restart_policy.maximum_retry_count == 3
+
+
+def test_configure_defaults():
+    option = ContainerOption().configure(image="ubuntu:20.04")
+    _assert_valid(option)
+    expected = (
+        ContainerOption()
+        .set_image("ubuntu:20.04")
+        .set_process(None)
+        .set_envs({})
+        .set_storage()
+        .set_ports()
+        .set_network()
+        .set_runtime(False, None, None)
+        .set_exit()
+    )
+    assert _payload(option) == _payload(expected)
+    assert option.cmd is None
+    assert option.host_config.shm_size is None
+
+
+def test_builder_builds_once():
+    option = (
+        ContainerOption()
+        .builder()
+        .set_image("ubuntu:20.04")
+        .set_envs({"A": "1"})
+        .set_envs({"B": "2"})
+        .set_ports(_PORTS[0])
+        .set_ports(_PORTS[1])
+        .set_cap("SYS_ADMIN")
+        .set_exit(restart_policy="always")
+        .build()
+    )
+    expected = (
+        ContainerOption()
+        .set_image("ubuntu:20.04")
+        .set_envs({"A": "1"})
+        .set_envs({"B": "2"})
+        .set_ports(_PORTS[0])
+        .set_ports(_PORTS[1])
+        .set_cap("SYS_ADMIN")
+        .set_exit(restart_policy="always")
+    )
+    _assert_valid(option)
+    assert _payload(option) == _payload(expected)
+    assert option.env == ["B=2", "A=1"]
+
+
+def test_set_exit_keeps_restart_policy():
+    option = ContainerOption().set_exit(restart_policy="always").set_exit()
+    assert option.host_config.restart_policy.name == "always"
+
+    with pytest.raises(ValueError):
+        ContainerOption().set_exit(restart_policy="always", maximum_retry=1)
+
+
+def test_replicate():
+    template = ContainerOption().configure(image="ubuntu:20.04", ports=_PORTS[:1])
+    replica = template.replicate(_PORTS[2], hostname="web-1")
+    _assert_valid(replica)
+    expected = template.set_ports(_PORTS[2]).set_network(
+        template.networking_config, "web-1"
+    )
+    assert _payload(replica) == _payload(expected)
+    assert replica.hostname == "web-1"
+    assert set(replica.exposed_ports) == {"8080/tcp", "53/udp"}
+
+
+def test_replicas_do_not_share_options():
+    template = ContainerOption().configure(
+        image="ubuntu:20.04", ports=_PORTS[:1], rdma=True
+    )
+    before = _payload(template)
+
+    first = template.replicate(_PORTS[1], hostname="web-0")
+    second = template.replicate(_PORTS[2], hostname="web-1")
+    first.host_config.cap_add.append("SYS_ADMIN")
+    first.exposed_ports["8080/tcp"] = None
+
+    assert _payload(template) == before
+    assert second.host_config.cap_add == ["IPC_LOCK", "SYS_NICE"]
+    assert second.host_config.port_bindings["8080/tcp"] == [
+        {"HostPort": "30000", "HostIp": "0.0.0.0"}
+    ]
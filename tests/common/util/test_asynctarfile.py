@@ -0,0 +1,93 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for asynchronous tarball utilities."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+
+import pytest
+
+from crane.common.util import asynctarfile
+
+
+@pytest.fixture
+def src_dir(tmp_path):
+    """Directory with a nested file to compress."""
+    path = tmp_path / "src"
+    (path / "nested").mkdir(parents=True)
+    (path / "top.txt").write_text("top")
+    (path / "nested" / "data.bin").write_bytes(bytes(range(256)) * 64)
+    return path
+
+
+@pytest.fixture
+def without_binaries(monkeypatch):
+    """Force the tarfile fallback."""
+    monkeypatch.setattr(asynctarfile, "_which", lambda cmd: None)
+
+
+def _assert_extracted(src_dir, dst_dir):
+    extracted = dst_dir / src_dir.name
+    assert (extracted / "top.txt").read_text() == "top"
+    assert (extracted / "nested" / "data.bin").read_bytes() == (
+        src_dir / "nested" / "data.bin"
+    ).read_bytes()
+
+
+@pytest.mark.usefixtures("without_binaries")
+def test_round_trip_fallback(tmp_path, src_dir):
+    tarball, dst_dir = tmp_path / "out.tar.gz", tmp_path / "dst"
+    asyncio.run(asynctarfile.compress(str(tarball), str(src_dir), level=9))
+    asyncio.run(asynctarfile.extract(str(dst_dir), str(tarball)))
+    _assert_extracted(src_dir, dst_dir)
+
+
+@pytest.mark.skipif(
+    shutil.which("tar") is None or shutil.which("pigz") is None,
+    reason="tar and pigz are required",
+)
+def test_round_trip_binaries(tmp_path, src_dir):
+    tarball, dst_dir = tmp_path / "out.tar.gz", tmp_path / "dst"
+    asyncio.run(asynctarfile.compress(str(tarball), str(src_dir)))
+    asyncio.run(asynctarfile.extract(str(dst_dir), str(tarball)))
+    _assert_extracted(src_dir, dst_dir)
+
+
+@pytest.mark.skipif(shutil.which("tar") is None, reason="tar is required")
+def test_pigz_spawn_failure_kills_tar(tmp_path, src_dir, monkeypatch):
+    binaries = {"tar": shutil.which("tar"), "pigz": str(tmp_path / "missing-pigz")}
+    monkeypatch.setattr(asynctarfile, "_which", binaries.get)
+
+    spawned = []
+    create_subprocess_exec = asyncio.create_subprocess_exec
+
+    async def _spawn(*args, **kwargs):
+        proc = await create_subprocess_exec(*args, **kwargs)
+        spawned.append(proc)
+        return proc
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", _spawn)
+
+    async def _compress():
+        with pytest.raises(FileNotFoundError):
+            await asynctarfile.compress(str(tmp_path / "out.tgz"), str(src_dir))
+        # tar must have been reaped before the error propagated
+        assert len(spawned) == 1
+        assert spawned[0].returncode is not None
+
+    asyncio.run(_compress())
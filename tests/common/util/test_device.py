@@ -0,0 +1,66 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for device utilities."""
+
+from __future__ import annotations
+
+import pytest
+
+from crane.common.util import device
+
+
+@pytest.fixture
+def infiniband_dir(tmp_path, monkeypatch):
+    """Fake /dev/infiniband directory."""
+    path = tmp_path / "infiniband"
+    path.mkdir()
+    monkeypatch.setattr(device, "_INFINIBAND_DIR", str(path))
+    return path
+
+
+@pytest.mark.parametrize(
+    "devices, expected",
+    [
+        (["rdma_cm", "uverbs0", "uverbs1"], True),
+        (["uverbs0", "uverbs1", "uverbs2"], True),
+        (["rdma_cm", "uverbs0"], False),
+        (["rdma_cm", "uverbs1", "uverbs2"], False),
+        ([], False),
+    ],
+)
+def test_check_rdma(infiniband_dir, devices, expected):
+    for name in devices:
+        (infiniband_dir / name).touch()
+    assert device.check_rdma() is expected
+
+
+def test_check_rdma_without_infiniband(tmp_path, monkeypatch):
+    monkeypatch.setattr(device, "_INFINIBAND_DIR", str(tmp_path / "missing"))
+    assert device.check_rdma() is False
+
+
+@pytest.mark.parametrize(
+    "gpus, expected",
+    [("", frozenset()), ("0", {0}), ("0,1,3", {0, 1, 3}), ("12", {12})],
+)
+def test_parse_gpu_indices(gpus, expected):
+    assert device.parse_gpu_indices(gpus) == expected
+
+
+@pytest.mark.parametrize("gpus", ["a", "0,", ",0", "0,,1", "-1", "1.0", "１"])
+def test_parse_gpu_indices_invalid(gpus):
+    with pytest.raises(TypeError):
+        device.parse_gpu_indices(gpus)
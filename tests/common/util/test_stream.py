@@ -0,0 +1,82 @@
+# Copyright (C) 2018-2021 Seoul National University
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Tests for stream utilities."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator
+
+import pytest
+
+from crane.common.util.stream import merge
+
+
+async def _count(n: int, delay: float = 0) -> AsyncIterator[int]:
+    for i in range(n):
+        await asyncio.sleep(delay)
+        yield i
+
+
+async def _cancelled_after(n: int) -> AsyncIterator[int]:
+    async for i in _count(n):
+        yield i
+    raise asyncio.CancelledError
+
+
+async def _collect(stream: AsyncIterator[int]) -> list[int]:
+    # bound the wait so that a hanging merge fails the test instead of blocking
+    async def _drain():
+        return [i async for i in stream]
+
+    return await asyncio.wait_for(_drain(), timeout=5)
+
+
+def test_merge_yields_all_elements():
+    merged = merge(_count(3), _count(2, 0.001), _count(0))
+    assert sorted(asyncio.run(_collect(merged))) == [0, 0, 1, 1, 2]
+
+
+def test_merge_single_stream():
+    assert asyncio.run(_collect(merge(_count(3)))) == [0, 1, 2]
+
+
+def test_merge_propagates_error():
+    async def _fail() -> AsyncIterator[int]:
+        yield 0
+        raise ValueError("stream failed")
+
+    with pytest.raises(ValueError, match="stream failed"):
+        asyncio.run(_collect(merge(_count(3, 0.001), _fail())))
+
+
+def test_merge_source_cancelled():
+    async def _run():
+        with pytest.raises(asyncio.CancelledError):
+            await _collect(merge(_count(3, 0.001), _cancelled_after(1)))
+
+    asyncio.run(_run())
+
+
+def test_merge_close_cancels_readers():
+    async def _run():
+        merged = merge(_count(100, 0.001), _count(100, 0.001))
+        await merged.__anext__()
+        await merged.aclose()
+        await asyncio.sleep(0.01)
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(_run())